@@ -2,55 +2,126 @@
 API Interface for Upper-Level Analysis Integration
 """
 import json
+import os
 import asyncio
-import aiofiles
+import heapq
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
-from pathlib import Path
 import logging
 from collections import Counter
 
+import numpy as np
+
 from data_processor import DataProcessor
-from reddit_client import RedditClient, AsyncRedditClient
+from reddit_client import AsyncRedditClient, gather_bounded
 from config import DataConfig, MonitoringConfig
 
+# Faster JSON decoding when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def _read_json(path: str) -> Dict:
+    """Read and decode a JSON file (runs in a worker thread)"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+# Flattened subreddit lookups, built once at import
+_CATEGORY_FLAT = {
+    category: tuple(subs) for category, subs in MonitoringConfig.SUBREDDITS.items()
+}
+_ALL_SUBS = tuple(MonitoringConfig.ALL_SUBREDDITS)
+
+# Sentiment average beyond which the market mood is bullish/bearish
+MOOD_THRESHOLD = 0.2
+
+# Indexed by (avg >= -MOOD_THRESHOLD) + (avg > MOOD_THRESHOLD)
+_MOODS = ('bearish', 'neutral', 'bullish')
+_MOODS_ARRAY = np.array(_MOODS)
+
+def classify_mood(averages) -> np.ndarray:
+    """Classify an array of sentiment averages into bullish/bearish/neutral moods"""
+    averages = np.asarray(averages, dtype=float)
+    index = (averages >= -MOOD_THRESHOLD).astype(int) + (averages > MOOD_THRESHOLD)
+    return _MOODS_ARRAY[index]
+
 class AnalysisAPI:
     """API interface for external analysis systems"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.data_processor = DataProcessor()
-        self.sync_client = RedditClient()
+        self._latest_path = os.path.join(DataConfig.EXPORTS_DIR, 'latest.json')
+        
+        # Decoded latest.json, reused until the file's identity changes;
+        # keyed on (inode, mtime, size) since latest.json is published by
+        # hard link/rename and a swapped-in file can share the old mtime
+        self._cache = None
+        self._cache_key = None
+        # In-flight (key, future) read shared by concurrent callers
+        self._pending_load = None
         
     async def get_latest_data(self) -> Optional[Dict]:
         """Get the most recent exported data"""
         try:
-            latest_file = Path(DataConfig.EXPORTS_DIR) / 'latest.json'
-            if latest_file.exists():
-                async with aiofiles.open(latest_file, 'r') as f:
-                    content = await f.read()
-                    return json.loads(content)
-            return None
+            try:
+                stat = await asyncio.to_thread(os.stat, self._latest_path)
+            except FileNotFoundError:
+                return None
+            key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            
+            if self._cache is not None and key == self._cache_key:
+                return self._cache
+            
+            # Concurrent callers (e.g. gathered getters) share a single read
+            if self._pending_load is None or self._pending_load[0] != key:
+                # Read and decode in a single worker-thread hop
+                pending = (key, asyncio.ensure_future(
+                    asyncio.to_thread(_read_json, self._latest_path)
+                ))
+                pending[1].add_done_callback(
+                    lambda future, pending=pending: self._finish_load(pending)
+                )
+                self._pending_load = pending
+            # Shielded so one cancelled caller doesn't cancel the read for
+            # everyone else waiting on it
+            return await asyncio.shield(self._pending_load[1])
         except Exception as e:
             self.logger.error(f"Error reading latest data: {e}")
             return None
     
+    def _finish_load(self, pending):
+        """Cache a finished shared read and clear it as the in-flight load"""
+        if self._pending_load is pending:
+            self._pending_load = None
+        key, future = pending
+        if not future.cancelled() and future.exception() is None:
+            self._cache = future.result()
+            self._cache_key = key
+    
     async def get_trending_tickers(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get currently trending stock tickers"""
-        data = await self.get_latest_data()
+        return self._trending_tickers_from(await self.get_latest_data(), limit)
+    
+    def _trending_tickers_from(self, data: Optional[Dict], limit: int = 10) -> List[Dict[str, Any]]:
+        """Project trending tickers from already-loaded export data"""
         if not data or 'trending_tickers' not in data:
             return []
         
-        tickers = data['trending_tickers']
+        top = heapq.nlargest(limit, data['trending_tickers'].items(), key=itemgetter(1))
         return [
             {
                 'ticker': ticker,
                 'mentions': count,
-                'rank': idx + 1
+                'rank': rank
             }
-            for idx, (ticker, count) in enumerate(
-                sorted(tickers.items(), key=lambda x: x[1], reverse=True)[:limit]
-            )
+            for rank, (ticker, count) in zip(range(1, len(top) + 1), top)
         ]
     
     async def get_subreddit_activity(self, subreddit: Optional[str] = None) -> Dict[str, Any]:
@@ -70,20 +141,33 @@ class AnalysisAPI:
                                 category: Optional[str] = None,
                                 limit: int = 20) -> List[Dict[str, Any]]:
         """Get high-priority posts, optionally filtered by category"""
-        data = await self.get_latest_data()
+        return self._priority_posts_from(await self.get_latest_data(), category, limit)
+    
+    def _priority_posts_from(self,
+                             data: Optional[Dict],
+                             category: Optional[str] = None,
+                             limit: int = 20) -> List[Dict[str, Any]]:
+        """Project priority posts from already-loaded export data"""
         if not data or 'recent_priority_posts' not in data:
             return []
         
         posts = data['recent_priority_posts']
         
         if category:
-            posts = [post for post in posts if post.get('category') == category]
+            # Stop scanning once `limit` matches are found
+            return list(islice(
+                (post for post in posts if post.get('category') == category),
+                limit
+            ))
         
         return posts[:limit]
     
     async def get_speculative_signals(self) -> Dict[str, Any]:
         """Get signals indicating speculative trading activity"""
-        data = await self.get_latest_data()
+        return self._speculative_signals_from(await self.get_latest_data())
+    
+    def _speculative_signals_from(self, data: Optional[Dict]) -> Dict[str, Any]:
+        """Project speculative signals from already-loaded export data"""
         if not data:
             return {}
         
@@ -91,14 +175,14 @@ class AnalysisAPI:
         activity = data.get('activity_summary', {})
         priority_posts = data.get('recent_priority_posts', [])
         
-        speculative_posts = [
-            post for post in priority_posts 
-            if post.get('is_speculative', False)
-        ]
+        speculative_posts = list(islice(
+            (post for post in priority_posts if post.get('is_speculative', False)),
+            10
+        ))
         
         # Get most active speculative subreddits
         subreddit_insights = data.get('subreddit_insights', {})
-        speculative_subreddits = [
+        speculative_subreddits = (
             {
                 'subreddit': name,
                 'speculative_ratio': info.get('speculative_ratio', 0),
@@ -106,22 +190,23 @@ class AnalysisAPI:
             }
             for name, info in subreddit_insights.items()
             if info.get('speculative_ratio', 0) > 0.1
-        ]
+        )
         
         return {
             'total_speculative_posts': activity.get('speculative_posts', 0),
             'speculative_ratio': activity.get('speculative_ratio', 0),
-            'recent_speculative_posts': speculative_posts[:10],
-            'active_speculative_subreddits': sorted(
-                speculative_subreddits,
-                key=lambda x: x['speculative_ratio'],
-                reverse=True
-            )[:5]
+            'recent_speculative_posts': speculative_posts,
+            'active_speculative_subreddits': heapq.nlargest(
+                5, speculative_subreddits, key=itemgetter('speculative_ratio')
+            )
         }
     
     async def get_sentiment_overview(self) -> Dict[str, Any]:
         """Get overall market sentiment from Reddit posts"""
-        data = await self.get_latest_data()
+        return self._sentiment_overview_from(await self.get_latest_data())
+    
+    def _sentiment_overview_from(self, data: Optional[Dict]) -> Dict[str, Any]:
+        """Project sentiment overview from already-loaded export data"""
         if not data or 'sentiment_analysis' not in data:
             return {}
         
@@ -129,12 +214,7 @@ class AnalysisAPI:
         
         # Add interpretation
         avg_sentiment = sentiment.get('average', 0)
-        if avg_sentiment > 0.2:
-            mood = 'bullish'
-        elif avg_sentiment < -0.2:
-            mood = 'bearish'
-        else:
-            mood = 'neutral'
+        mood = _MOODS[(avg_sentiment >= -MOOD_THRESHOLD) + (avg_sentiment > MOOD_THRESHOLD)]
         
         return {
             **sentiment,
@@ -149,25 +229,35 @@ class AnalysisAPI:
         try:
             # Get fresh data from Reddit
             posts = []
-            target_subreddits = MonitoringConfig.ALL_SUBREDDITS
+            target_subreddits = _ALL_SUBS
             
             if categories:
-                target_subreddits = []
-                for category in categories:
-                    if category in MonitoringConfig.SUBREDDITS:
-                        target_subreddits.extend(MonitoringConfig.SUBREDDITS[category])
+                target_subreddits = tuple(chain.from_iterable(
+                    _CATEGORY_FLAT[category] for category in categories
+                    if category in _CATEGORY_FLAT
+                ))
+            
+            # Fetch recent posts concurrently on one async client; the sync
+            # PRAW client isn't safe to share across threads
+            target_subreddits = target_subreddits[:5]  # Limit to prevent rate limiting
+            async with AsyncRedditClient() as client:
+                results = await asyncio.gather(
+                    *[
+                        client.get_hot_posts(subreddit, limit=10)
+                        for subreddit in target_subreddits
+                    ],
+                    return_exceptions=True
+                )
             
-            # Fetch recent posts
-            for subreddit in target_subreddits[:5]:  # Limit to prevent rate limiting
-                try:
-                    subreddit_posts = self.sync_client.get_hot_posts(subreddit, limit=10)
-                    filtered_posts = [
-                        post for post in subreddit_posts
-                        if post.score >= min_score and post.is_recent(2)  # Last 2 hours
-                    ]
-                    posts.extend(filtered_posts)
-                except Exception as e:
-                    self.logger.warning(f"Error fetching from r/{subreddit}: {e}")
+            for subreddit, subreddit_posts in zip(target_subreddits, results):
+                if isinstance(subreddit_posts, Exception):
+                    self.logger.warning(f"Error fetching from r/{subreddit}: {subreddit_posts}")
+                    continue
+                filtered_posts = [
+                    post for post in subreddit_posts
+                    if post.score >= min_score and post.is_recent(2)  # Last 2 hours
+                ]
+                posts.extend(filtered_posts)
             
             # Convert to API format
             return [
@@ -183,7 +273,7 @@ class AnalysisAPI:
                     'category': post.category,
                     'upvote_ratio': post.upvote_ratio
                 }
-                for post in sorted(posts, key=lambda x: x.score, reverse=True)[:20]
+                for post in heapq.nlargest(20, posts, key=attrgetter('score'))
             ]
             
         except Exception as e:
@@ -195,6 +285,8 @@ class AnalysisAPI:
                                 hours_back: int = 24,
                                 min_engagement: int = 10) -> Dict[str, Any]:
         """Export custom dataset based on specific criteria"""
+        # Request timestamp, taken once up front
+        now_iso = datetime.now(timezone.utc).isoformat()
         try:
             all_posts = []
             
@@ -208,7 +300,7 @@ class AnalysisAPI:
                         client.get_rising_posts(subreddit, limit=25)
                     ])
                 
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+                results = await gather_bounded(tasks, return_exceptions=True)
                 
                 for result in results:
                     if isinstance(result, list):
@@ -216,18 +308,36 @@ class AnalysisAPI:
             
             # Filter posts
             filtered_posts = []
+            seen_ids = set()
             for post in all_posts:
-                if (post.is_recent(hours_back) and 
-                    post.score >= min_engagement and
-                    post.id not in [p.id for p in filtered_posts]):  # Deduplicate
+                if (post.id not in seen_ids and  # Deduplicate
+                    post.is_recent(hours_back) and
+                    post.score >= min_engagement):
+                    seen_ids.add(post.id)
                     filtered_posts.append(post)
             
             # Process through data processor for analysis
             self.data_processor.add_posts(filtered_posts)
             
+            # Classify each post once; reused for both the posts list and summary
+            spec_flags = dict(zip(
+                (post.id for post in filtered_posts),
+                self.data_processor.speculative_flags(filtered_posts)
+            ))
+            
+            # Gather summary statistics in a single pass
+            total_score = 0
+            speculative_count = 0
+            subreddit_counts = Counter()
+            for post in filtered_posts:
+                total_score += post.score
+                subreddit_counts[post.subreddit] += 1
+                if spec_flags[post.id]:
+                    speculative_count += 1
+            
             return {
                 'metadata': {
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': now_iso,
                     'subreddits_requested': subreddits,
                     'hours_back': hours_back,
                     'min_engagement': min_engagement,
@@ -244,19 +354,16 @@ class AnalysisAPI:
                         'url': post.url,
                         'selftext': post.selftext[:500] if post.selftext else '',
                         'category': post.category,
-                        'is_speculative': self.data_processor.is_speculative_post(post)
+                        'is_speculative': spec_flags[post.id]
                     }
-                    for post in sorted(filtered_posts, key=lambda x: x.score, reverse=True)
+                    for post in sorted(filtered_posts, key=attrgetter('score'), reverse=True)
                 ],
                 'trending_tickers': dict(self.data_processor.get_trending_tickers(10)),
                 'summary': {
                     'total_posts': len(filtered_posts),
-                    'speculative_posts': sum(
-                        1 for post in filtered_posts 
-                        if self.data_processor.is_speculative_post(post)
-                    ),
-                    'avg_score': sum(post.score for post in filtered_posts) / len(filtered_posts) if filtered_posts else 0,
-                    'subreddit_distribution': dict(Counter(post.subreddit for post in filtered_posts))
+                    'speculative_posts': speculative_count,
+                    'avg_score': total_score / len(filtered_posts) if filtered_posts else 0,
+                    'subreddit_distribution': dict(subreddit_counts)
                 }
             }
             
@@ -290,8 +397,12 @@ class SimpleAPI:
     
     async def alert_check(self) -> Dict[str, Any]:
         """Check for alert-worthy conditions"""
-        signals = await self.api.get_speculative_signals()
-        sentiment = await self.api.get_sentiment_overview()
+        now_iso = datetime.now(timezone.utc).isoformat()
+        
+        # One data fetch shared by both checks
+        data = await self.api.get_latest_data()
+        signals = self.api._speculative_signals_from(data)
+        sentiment = self.api._sentiment_overview_from(data)
         
         alerts = []
         
@@ -313,7 +424,7 @@ class SimpleAPI:
             })
         
         return {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': now_iso,
             'alerts': alerts,
             'alert_count': len(alerts)
         }
@@ -322,10 +433,11 @@ class SimpleAPI:
 async def get_reddit_insights() -> Dict[str, Any]:
     """Quick function to get current Reddit market insights"""
     api = AnalysisAPI()
+    data = await api.get_latest_data()
     
     return {
-        'trending_tickers': await api.get_trending_tickers(10),
-        'market_sentiment': await api.get_sentiment_overview(),
-        'speculative_signals': await api.get_speculative_signals(),
-        'priority_posts': await api.get_priority_posts(limit=10)
+        'trending_tickers': api._trending_tickers_from(data, 10),
+        'market_sentiment': api._sentiment_overview_from(data),
+        'speculative_signals': api._speculative_signals_from(data),
+        'priority_posts': api._priority_posts_from(data, limit=10)
     }
\ No newline at end of file
@@ -3,27 +3,62 @@ AI-powered content summarization for Reddit posts
 Generates concise, one-sentence summaries optimized for mobile consumption
 """
 
+import os
 import re
+import importlib
+import importlib.util
 import logging
 import asyncio
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import json
+import xml.etree.ElementTree as ET
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-# For local LLM integration (future)
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# For local LLM integration (future); only located here, imported on first use
+OPENAI_AVAILABLE = importlib.util.find_spec('openai') is not None
 
-# For sentiment analysis
+# For sentiment analysis; only the bundled polarity lexicon file is read,
+# so the package itself (and NLTK behind it) is never imported
+_TEXTBLOB_SPEC = importlib.util.find_spec('textblob')
+TEXTBLOB_AVAILABLE = _TEXTBLOB_SPEC is not None
+
+# For single-pass keyword matching
 try:
-    from textblob import TextBlob
-    TEXTBLOB_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    TEXTBLOB_AVAILABLE = False
+    AHOCORASICK_AVAILABLE = False
+
+# Sentence terminators folded onto '.' so splitting needs no regex
+_SENTENCE_DELIMITERS = str.maketrans('!?', '..')
+
+@lru_cache(maxsize=1)
+def _load_polarity_lexicon() -> Dict[str, float]:
+    """Load TextBlob's word polarities, averaged across senses"""
+    path = os.path.join(os.path.dirname(_TEXTBLOB_SPEC.origin), 'en', 'en-sentiment.xml')
+    senses = defaultdict(list)
+    for word in ET.parse(path).getroot().iter('word'):
+        senses[word.get('form').lower()].append(float(word.get('polarity', 0.0)))
+    return {form: sum(values) / len(values) for form, values in senses.items()}
+
+# LRU of finished summaries shared by every ContentSummarizer in the
+# process, so request handlers that build a fresh summarizer still hit it
+SUMMARY_CACHE_SIZE = 4096
+_summary_cache = OrderedDict()
+
+# Per-process summarizer used by ContentSummarizer's worker pool
+_worker_summarizer = None
+
+def _local_summary_worker(text: str, post_data: Dict) -> Tuple[Dict, Dict, int]:
+    """Run local summarization in a worker process"""
+    global _worker_summarizer
+    if _worker_summarizer is None:
+        _worker_summarizer = ContentSummarizer('local')
+    return _worker_summarizer._analyze_locally(text, post_data)
 
 @dataclass
 class SummarizedContent:
@@ -53,14 +88,57 @@ class ContentSummarizer:
         # Initialize sentiment analyzer
         self.sentiment_analyzer = self._setup_sentiment_analyzer()
         
+        # Cap concurrent OpenAI requests; the semaphore is created lazily so
+        # it binds to whichever event loop ends up running the summarizer
+        self.openai_concurrency = int(os.getenv('OPENAI_CONCURRENCY', '20'))
+        self._openai_semaphore = None
+        self.openai_client = None
+        
+        # Process pool for local summarization of large batches; a single
+        # post is cheaper to summarize in-process than to ship to a worker,
+        # so batches smaller than process_min_batch stay in this process
+        self.process_workers = int(os.getenv('SUMMARIZER_PROCESSES', str(os.cpu_count() or 1)))
+        self.process_min_batch = int(os.getenv('SUMMARIZER_PROCESS_MIN_BATCH', '64'))
+        self._process_pool = None
+        
         # Initialize OpenAI if available and configured
         if model_type == 'openai' and OPENAI_AVAILABLE:
             self._setup_openai()
         
         # Regex patterns for different content types
         self.ticker_pattern = re.compile(r'\$([A-Z]{1,5})\b')
-        self.price_pattern = re.compile(r'\$?(\d+(?:\.\d{2})?)\s*(?:dollars?|USD|per share)')
-        self.percentage_pattern = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+        self.number_pattern = re.compile(r'\d+')
+        self.percent_figure_pattern = re.compile(r'\d+(?:\.\d+)?%')
+        
+        # Single-pass financial scan; the ticker group sits in a lookahead so
+        # technical terms right after a '$' are still seen, as with findall
+        self.financial_scan_pattern = re.compile(
+            r'\$(?=(?P<ticker>[A-Z]{1,5})\b)'
+            r'|(?P<percentage>\d+(?:\.\d+)?)\s*%'
+            r'|\$?(?P<price>\d+(?:\.\d{2})?)\s*(?:dollars?|USD|per share)'
+            r'|(?i:\b(?P<technical>ROI|EBITDA|P/E|EPS|beta|volatility|derivatives|options)\b)'
+        )
+        
+        # Markdown cleanup patterns
+        self.link_pattern = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+        self.bold_pattern = re.compile(r'\*\*([^*]+)\*\*')
+        self.italic_pattern = re.compile(r'\*([^*]+)\*')
+        self.whitespace_pattern = re.compile(r'\s+')
+        self.word_pattern = re.compile(r"[a-z]+(?:'[a-z]+)?")
+        
+        # Action keywords (matched as whole words, including their -s, -es,
+        # -ed and -ing forms) and the item each suggests
+        self.action_items = {
+            'buy': 'Consider buying',
+            'sell': 'Consider selling',
+            'hold': 'Hold position',
+            'watch': 'Monitor closely',
+            'monitor': 'Monitor closely'
+        }
+        self.action_order = list(dict.fromkeys(self.action_items.values()))
+        self.action_pattern = re.compile(
+            r'\b(' + '|'.join(self.action_items) + r')(?:s|es|ed|ing)?\b'
+        )
         
         # Financial keywords for enhanced processing
         self.financial_keywords = {
@@ -69,11 +147,48 @@ class ContentSummarizer:
             'neutral': ['hold', 'stable', 'flat', 'sideways', 'range'],
             'speculative': ['yolo', 'diamond hands', 'hodl', 'ape', 'squeeze', 'gamma']
         }
+        self.keyword_automaton = self._build_keyword_automaton()
+    
+    def _build_keyword_automaton(self):
+        """Build an Aho-Corasick automaton over all financial keywords"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keywords in self.financial_keywords.values():
+            for keyword in keywords:
+                automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def _find_keywords(self, text_lower: str) -> set:
+        """Return the set of financial keywords occurring in lowercased text"""
+        if self.keyword_automaton is not None:
+            return {keyword for _, keyword in self.keyword_automaton.iter(text_lower)}
+        
+        return {
+            keyword
+            for keywords in self.financial_keywords.values()
+            for keyword in keywords
+            if keyword in text_lower
+        }
+    
+    def _scan_financial(self, text: str) -> Dict[str, List[str]]:
+        """Collect tickers, percentages, prices and technical terms in one pass"""
+        found = {'ticker': [], 'percentage': [], 'price': [], 'technical': []}
+        for match in self.financial_scan_pattern.finditer(text):
+            kind = match.lastgroup
+            found[kind].append(match.group(kind))
+        return found
     
     def _setup_sentiment_analyzer(self):
         """Setup sentiment analysis component"""
         if TEXTBLOB_AVAILABLE:
-            return TextBlob
+            try:
+                return _load_polarity_lexicon()
+            except Exception as e:
+                self.logger.warning(f"Sentiment lexicon unavailable ({e}), using rule-based sentiment")
+                return None
         else:
             self.logger.warning("TextBlob not available, using rule-based sentiment")
             return None
@@ -82,43 +197,94 @@ class ContentSummarizer:
         """Setup OpenAI API if credentials available"""
         try:
             # OpenAI API key should be in environment or config
-            openai.api_key = os.getenv('OPENAI_API_KEY')
-            if not openai.api_key:
+            api_key = os.getenv('OPENAI_API_KEY')
+            if not api_key:
                 self.logger.warning("OpenAI API key not found, falling back to local processing")
                 self.model_type = 'local'
+                return
+            
+            # One async client per summarizer so its connection pool is
+            # reused across every post in a batch
+            openai = importlib.import_module('openai')
+            self.openai_client = openai.AsyncOpenAI(api_key=api_key)
         except Exception as e:
             self.logger.error(f"OpenAI setup failed: {e}")
             self.model_type = 'local'
     
-    async def summarize_post(self, post_data: Dict) -> SummarizedContent:
+    async def close(self):
+        """Release the OpenAI client's pooled connections and worker processes"""
+        if self.openai_client is not None:
+            await self.openai_client.close()
+            self.openai_client = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+    
+    def uses_process_pool(self, batch_size: int) -> bool:
+        """Whether a batch this size is worth summarizing in worker processes"""
+        return self.process_workers > 1 and batch_size >= self.process_min_batch
+    
+    def _summary_cache_key(self, post_data: Dict) -> Optional[Tuple]:
+        """Key for the summary cache from the fields a summary depends on.
+        
+        Posts without an id aren't cached. The text is hashed rather than kept
+        so the cache doesn't hold every post body; an edited post hashes
+        differently and is summarized again.
+        """
+        if not post_data.get('id'):
+            return None
+        return (
+            self.model_type,
+            post_data['id'],
+            post_data.get('subreddit', ''),
+            post_data.get('category', 'general'),
+            hash((post_data.get('title', ''), post_data.get('selftext', '')))
+        )
+    
+    async def summarize_post(self, post_data: Dict, use_pool: bool = False) -> SummarizedContent:
         """
         Main summarization method that processes a Reddit post
         and returns enhanced, digestible content
         """
         start_time = asyncio.get_event_loop().time()
         
+        cache_key = self._summary_cache_key(post_data)
+        if cache_key is not None:
+            cached = _summary_cache.get(cache_key)
+            if cached is not None:
+                _summary_cache.move_to_end(cache_key)
+                return cached
+        
         try:
             # Extract text content
             full_text = self._extract_content(post_data)
             
             # Generate summary based on available model
             if self.model_type == 'openai' and OPENAI_AVAILABLE:
-                summary_data = await self._summarize_with_openai(full_text, post_data)
+                financial_scan = self._scan_financial(full_text)
+                sentences = self._split_into_sentences(full_text)
+                
+                # Financial extraction and complexity don't depend on the
+                # summary, so run them in a thread while the API call is pending
+                summary_data, (financial_data, complexity) = await asyncio.gather(
+                    self._summarize_with_openai(full_text, post_data),
+                    asyncio.to_thread(self._extract_metrics, full_text, financial_scan, sentences)
+                )
+            elif use_pool and self.process_workers > 1:
+                if self._process_pool is None:
+                    self._process_pool = ProcessPoolExecutor(max_workers=self.process_workers)
+                summary_data, financial_data, complexity = await asyncio.get_running_loop().run_in_executor(
+                    self._process_pool, _local_summary_worker, full_text, post_data
+                )
             else:
-                summary_data = await self._summarize_locally(full_text, post_data)
-            
-            # Extract financial data
-            financial_data = self._extract_financial_info(full_text)
+                summary_data, financial_data, complexity = self._analyze_locally(full_text, post_data)
             
             # Generate chart data for visualization
             chart_data = self._generate_chart_data(post_data, financial_data)
             
-            # Calculate complexity score
-            complexity = self._calculate_complexity(full_text)
-            
             generation_time = asyncio.get_event_loop().time() - start_time
             
-            return SummarizedContent(
+            summary = SummarizedContent(
                 original_id=post_data.get('id', ''),
                 summary_sentence=summary_data['summary'],
                 key_points=summary_data['key_points'],
@@ -132,10 +298,32 @@ class ContentSummarizer:
                 generation_time=generation_time
             )
             
+            if cache_key is not None:
+                _summary_cache[cache_key] = summary
+                if len(_summary_cache) > SUMMARY_CACHE_SIZE:
+                    _summary_cache.popitem(last=False)
+            
+            return summary
+        
         except Exception as e:
             self.logger.error(f"Summarization failed for post {post_data.get('id')}: {e}")
             return self._create_fallback_summary(post_data)
     
+    def _analyze_locally(self, text: str, post_data: Dict) -> Tuple[Dict, Dict, int]:
+        """Summary, financial data and complexity for a post, all computed locally"""
+        financial_scan = self._scan_financial(text)
+        sentences = self._split_into_sentences(text)
+        summary_data = self._build_local_summary(text, post_data, financial_scan, sentences)
+        financial_data, complexity = self._extract_metrics(text, financial_scan, sentences)
+        return summary_data, financial_data, complexity
+    
+    def _extract_metrics(self, text: str, financial_scan: Dict,
+                         sentences: List[str]) -> Tuple[Dict, int]:
+        """Extract financial data and complexity score for a post"""
+        financial_data = self._extract_financial_info(text, financial_scan)
+        complexity = self._calculate_complexity(text, financial_scan, sentences)
+        return financial_data, complexity
+    
     def _extract_content(self, post_data: Dict) -> str:
         """Extract and clean text content from post"""
         title = post_data.get('title', '')
@@ -145,11 +333,10 @@ class ContentSummarizer:
         full_text = f"{title}. {selftext}".strip()
         
         # Clean markdown and formatting
-        full_text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', full_text)  # Links
-        full_text = re.sub(r'\*\*([^*]+)\*\*', r'\1', full_text)  # Bold
-        full_text = re.sub(r'\*([^*]+)\*', r'\1', full_text)  # Italic
-        full_text = re.sub(r'\n+', ' ', full_text)  # Multiple newlines
-        full_text = re.sub(r'\s+', ' ', full_text).strip()  # Multiple spaces
+        full_text = self.link_pattern.sub(r'\1', full_text)  # Links
+        full_text = self.bold_pattern.sub(r'\1', full_text)  # Bold
+        full_text = self.italic_pattern.sub(r'\1', full_text)  # Italic
+        full_text = self.whitespace_pattern.sub(' ', full_text).strip()  # Newlines and spaces
         
         return full_text
     
@@ -158,15 +345,19 @@ class ContentSummarizer:
         try:
             prompt = self._create_openai_prompt(text, post_data.get('subreddit', ''))
             
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert at summarizing Reddit posts into digestible insights for busy users."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=200,
-                temperature=0.3
-            )
+            if self._openai_semaphore is None:
+                self._openai_semaphore = asyncio.Semaphore(self.openai_concurrency)
+            
+            async with self._openai_semaphore:
+                response = await self.openai_client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=[
+                        {"role": "system", "content": "You are an expert at summarizing Reddit posts into digestible insights for busy users."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=200,
+                    temperature=0.3
+                )
             
             content = response.choices[0].message.content
             return self._parse_ai_response(content)
@@ -177,26 +368,36 @@ class ContentSummarizer:
     
     async def _summarize_locally(self, text: str, post_data: Dict) -> Dict:
         """Local summarization using rule-based approach"""
+        return self._build_local_summary(text, post_data)
+    
+    def _build_local_summary(self, text: str, post_data: Dict,
+                             financial_scan: Optional[Dict] = None,
+                             sentences: Optional[List[str]] = None) -> Dict:
+        """Rule-based summary, key points, sentiment and action items"""
         # Extract key sentences using simple scoring
-        sentences = self._split_into_sentences(text)
+        if sentences is None:
+            sentences = self._split_into_sentences(text)
         scored_sentences = self._score_sentences(sentences, post_data.get('subreddit', ''))
         
         # Generate summary from top sentence
         best_sentence = max(scored_sentences, key=lambda x: x[1]) if scored_sentences else ("", 0)
         summary = self._refine_summary(best_sentence[0], post_data)
         
+        # Lowercase once for all keyword-based extraction below
+        text_lower = text.lower()
+        
         # Extract key points
-        key_points = self._extract_key_points(text, post_data.get('subreddit', ''))
+        key_points = self._extract_key_points(text, post_data.get('subreddit', ''), financial_scan, text_lower)
         
         # Determine sentiment
-        sentiment_data = self._analyze_sentiment(text)
+        sentiment_data = self._analyze_sentiment(text_lower)
         
         return {
             'summary': summary,
             'key_points': key_points,
             'sentiment': sentiment_data['sentiment'],
             'confidence': sentiment_data['confidence'],
-            'action_items': self._extract_action_items(text)
+            'action_items': self._extract_action_items(text_lower)
         }
     
     def _create_openai_prompt(self, text: str, subreddit: str) -> str:
@@ -241,14 +442,17 @@ class ContentSummarizer:
     
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences"""
-        sentences = re.split(r'[.!?]+', text)
+        sentences = text.translate(_SENTENCE_DELIMITERS).split('.')
         return [s.strip() for s in sentences if len(s.strip()) > 10]
     
     def _score_sentences(self, sentences: List[str], subreddit: str) -> List[Tuple[str, float]]:
         """Score sentences based on importance indicators"""
         scored = []
+        find_tickers = self.ticker_pattern.findall
+        has_number = self.number_pattern.search
+        has_percent = self.percent_figure_pattern.search
         
-        for sentence in sentences:
+        for i, sentence in enumerate(sentences):
             score = 0.0
             sentence_lower = sentence.lower()
             
@@ -257,22 +461,20 @@ class ContentSummarizer:
             score += length_score * 0.2
             
             # Financial keywords
-            for sentiment, keywords in self.financial_keywords.items():
-                matches = sum(1 for kw in keywords if kw in sentence_lower)
-                score += matches * 0.3
+            score += len(self._find_keywords(sentence_lower)) * 0.3
             
             # Ticker mentions
-            ticker_matches = len(self.ticker_pattern.findall(sentence))
+            ticker_matches = len(find_tickers(sentence))
             score += ticker_matches * 0.4
             
             # Numbers and percentages (important for financial content)
-            if re.search(r'\d+', sentence):
+            if has_number(sentence):
                 score += 0.2
-            if re.search(r'\d+(?:\.\d+)?%', sentence):
+            if has_percent(sentence):
                 score += 0.3
             
             # Position in text (first sentences often more important)
-            position_penalty = sentences.index(sentence) * 0.1
+            position_penalty = i * 0.1
             score = max(0, score - position_penalty)
             
             scored.append((sentence, score))
@@ -291,30 +493,36 @@ class ContentSummarizer:
         # Limit length for mobile
         if len(sentence) > 120:
             words = sentence.split()
-            while len(' '.join(words)) > 117 and len(words) > 5:
-                words.pop()
+            # Track the joined length instead of re-joining after every pop
+            joined_length = sum(map(len, words)) + len(words) - 1
+            while joined_length > 117 and len(words) > 5:
+                joined_length -= len(words.pop()) + 1
             sentence = ' '.join(words) + '...'
         
         return sentence
     
-    def _extract_key_points(self, text: str, subreddit: str) -> List[str]:
+    def _extract_key_points(self, text: str, subreddit: str,
+                            financial_scan: Optional[Dict] = None,
+                            text_lower: Optional[str] = None) -> List[str]:
         """Extract 2-3 key points from the content"""
         key_points = []
+        if financial_scan is None:
+            financial_scan = self._scan_financial(text)
         
         # Extract tickers
-        tickers = self.ticker_pattern.findall(text)
+        tickers = financial_scan['ticker']
         if tickers:
             key_points.append(f"${tickers[0]}" if len(tickers) == 1 else f"{len(tickers)} stocks")
         
         # Extract percentages
-        percentages = self.percentage_pattern.findall(text)
+        percentages = financial_scan['percentage']
         if percentages:
             key_points.append(f"{percentages[0]}% change")
         
         # Extract sentiment keywords
-        text_lower = text.lower()
+        found = self._find_keywords(text_lower if text_lower is not None else text.lower())
         for sentiment, keywords in self.financial_keywords.items():
-            matches = [kw for kw in keywords if kw in text_lower]
+            matches = [kw for kw in keywords if kw in found]
             if matches:
                 key_points.append(matches[0].title())
                 break
@@ -328,11 +536,12 @@ class ContentSummarizer:
         
         return key_points[:3]
     
-    def _analyze_sentiment(self, text: str) -> Dict:
-        """Analyze sentiment with confidence score"""
+    def _analyze_sentiment(self, text_lower: str) -> Dict:
+        """Analyze sentiment of lowercased text with confidence score"""
         if self.sentiment_analyzer:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
+            lexicon = self.sentiment_analyzer
+            hits = [lexicon[word] for word in self.word_pattern.findall(text_lower) if word in lexicon]
+            polarity = sum(hits) / len(hits) if hits else 0.0
             
             if polarity > 0.1:
                 sentiment = "Positive" if polarity < 0.5 else "Bullish"
@@ -344,9 +553,9 @@ class ContentSummarizer:
             confidence = min(abs(polarity) * 2, 1.0)
         else:
             # Rule-based sentiment
-            text_lower = text.lower()
-            positive_count = sum(1 for kw in self.financial_keywords['bullish'] if kw in text_lower)
-            negative_count = sum(1 for kw in self.financial_keywords['bearish'] if kw in text_lower)
+            found = self._find_keywords(text_lower)
+            positive_count = sum(1 for kw in self.financial_keywords['bullish'] if kw in found)
+            negative_count = sum(1 for kw in self.financial_keywords['bearish'] if kw in found)
             
             if positive_count > negative_count:
                 sentiment = "Bullish"
@@ -363,16 +572,18 @@ class ContentSummarizer:
             'confidence': confidence
         }
     
-    def _extract_financial_info(self, text: str) -> Dict:
+    def _extract_financial_info(self, text: str, financial_scan: Optional[Dict] = None) -> Dict:
         """Extract financial data for chart generation"""
-        tickers = list(set(self.ticker_pattern.findall(text)))
-        prices = [float(m) for m in self.price_pattern.findall(text)]
-        percentages = [float(m) for m in self.percentage_pattern.findall(text)]
+        if financial_scan is None:
+            financial_scan = self._scan_financial(text)
+        
+        # dict.fromkeys dedupes while keeping first-mention order
+        tickers = list(dict.fromkeys(financial_scan['ticker']))
         
         return {
             'tickers': tickers[:5],  # Limit to 5 tickers
-            'prices': prices[:3],
-            'percentages': percentages[:3]
+            'prices': [float(m) for m in financial_scan['price'][:3]],
+            'percentages': [float(m) for m in financial_scan['percentage'][:3]]
         }
     
     def _generate_chart_data(self, post_data: Dict, financial_data: Dict) -> Optional[Dict]:
@@ -399,34 +610,37 @@ class ContentSummarizer:
             'label': 'Value'
         }
     
-    def _calculate_complexity(self, text: str) -> int:
+    def _calculate_complexity(self, text: str, financial_scan: Optional[Dict] = None,
+                              sentences: Optional[List[str]] = None) -> int:
         """Calculate content complexity on 1-5 scale"""
-        word_count = len(text.split())
-        sentence_count = len(self._split_into_sentences(text))
+        if financial_scan is None:
+            financial_scan = self._scan_financial(text)
+        if sentences is None:
+            sentences = self._split_into_sentences(text)
+        
+        # _extract_content collapses whitespace to single spaces, so
+        # counting separators avoids building a throwaway word list
+        word_count = text.count(' ') + 1 if text else 0
+        sentence_count = len(sentences)
         
         # Average words per sentence
         avg_sentence_length = word_count / max(sentence_count, 1)
         
         # Technical terms count
-        technical_terms = len(re.findall(r'\b(?:ROI|EBITDA|P/E|EPS|beta|volatility|derivatives|options)\b', text, re.I))
+        technical_terms = len(financial_scan['technical'])
         
         complexity = 1
         if avg_sentence_length > 15: complexity += 1
         if word_count > 100: complexity += 1
         if technical_terms > 2: complexity += 1
-        if len(self.ticker_pattern.findall(text)) > 3: complexity += 1
+        if len(financial_scan['ticker']) > 3: complexity += 1
         
         return min(complexity, 5)
     
-    def _extract_action_items(self, text: str) -> List[str]:
-        """Extract actionable insights"""
-        actions = []
-        text_lower = text.lower()
-        
-        if 'buy' in text_lower: actions.append('Consider buying')
-        if 'sell' in text_lower: actions.append('Consider selling')
-        if 'hold' in text_lower: actions.append('Hold position')
-        if 'watch' in text_lower or 'monitor' in text_lower: actions.append('Monitor closely')
+    def _extract_action_items(self, text_lower: str) -> List[str]:
+        """Extract actionable insights from lowercased text"""
+        found = {self.action_items[m.group(1)] for m in self.action_pattern.finditer(text_lower)}
+        actions = [action for action in self.action_order if action in found]
         
         return actions[:2]
     
@@ -452,8 +666,29 @@ class ContentSummarizer:
 # Batch processing for multiple posts
 async def batch_summarize(posts: List[Dict], summarizer: ContentSummarizer = None) -> List[SummarizedContent]:
     """Process multiple posts efficiently"""
-    if not summarizer:
+    owns_summarizer = not summarizer
+    if owns_summarizer:
+        summarizer = ContentSummarizer()
+    
+    try:
+        use_pool = summarizer.uses_process_pool(len(posts))
+        tasks = [summarizer.summarize_post(post, use_pool) for post in posts]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        if owns_summarizer:
+            await summarizer.close()
+
+async def stream_summarize(posts: List[Dict], summarizer: ContentSummarizer = None) -> AsyncIterator[SummarizedContent]:
+    """Yield summaries as each post finishes rather than in input order"""
+    owns_summarizer = not summarizer
+    if owns_summarizer:
         summarizer = ContentSummarizer()
     
-    tasks = [summarizer.summarize_post(post) for post in posts]
-    return await asyncio.gather(*tasks, return_exceptions=True)
\ No newline at end of file
+    try:
+        use_pool = summarizer.uses_process_pool(len(posts))
+        tasks = [summarizer.summarize_post(post, use_pool) for post in posts]
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        if owns_summarizer:
+            await summarizer.close()
\ No newline at end of file
@@ -2,22 +2,35 @@
 Reddit Data Engine Configuration
 """
 import os
+import re
 import json
+from functools import lru_cache
 from typing import Dict, List
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 load_dotenv()
 
-# Try to load from config.json first, fall back to environment variables
-config_file = Path('config.json')
-config_data = {}
-if config_file.exists():
+@lru_cache(maxsize=1)
+def _load_config() -> Dict:
+    """Read config.json once per process; empty dict if missing or invalid"""
+    config_file = Path('config.json')
+    if not config_file.exists():
+        return {}
     try:
-        with open(config_file, 'r') as f:
-            config_data = json.load(f)
+        raw = config_file.read_bytes()
+        return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
     except Exception:
-        pass
+        return {}
+
+# Try to load from config.json first, fall back to environment variables
+config_data = _load_config()
 
 class RedditConfig:
     """Reddit API configuration"""
@@ -38,8 +51,8 @@ class MonitoringConfig:
     # Target subreddits - can be overridden by config.json
     if 'subreddits' in monitoring_config:
         # Simple list from config.json
-        ALL_SUBREDDITS = monitoring_config['subreddits']
-        SUBREDDITS = {'general': ALL_SUBREDDITS}
+        ALL_SUBREDDITS = tuple(monitoring_config['subreddits'])
+        SUBREDDITS = {'general': list(ALL_SUBREDDITS)}
     else:
         # Default categorized subreddits
         SUBREDDITS: Dict[str, List[str]] = {
@@ -51,13 +64,16 @@ class MonitoringConfig:
             'trading': ['trading', 'technicalanalysis', 'daytrading'],
             'sector_specific': ['stockmarket', 'biotech_stocks', 'SecurityAnalysis']
         }
-        ALL_SUBREDDITS = [sub for subs in SUBREDDITS.values() for sub in subs]
+        ALL_SUBREDDITS = tuple(sub for subs in SUBREDDITS.values() for sub in subs)
     
     # Monitoring intervals (seconds)
     HOT_POSTS_INTERVAL = monitoring_config.get('refresh_interval', 60)
     NEW_POSTS_INTERVAL = 30
     RISING_POSTS_INTERVAL = 45
     
+    # Maximum concurrent Reddit API requests per batch
+    MAX_CONCURRENT_FETCHES = 8
+    
     # Post filtering criteria
     MIN_SCORE = 10
     MIN_COMMENTS = 5
@@ -75,6 +91,8 @@ class MonitoringConfig:
         r'\b[A-Z]{1,5}\s+(calls?|puts?)\b',  # Options mentions
         r'\b(buy|sell|hold)\s+[A-Z]{1,5}\b',  # Trading recommendations
     ]
+    # All priority patterns fused so a post is scanned once
+    PRIORITY_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in PRIORITY_PATTERNS))
 
 class DataConfig:
     """Data processing and export settings"""
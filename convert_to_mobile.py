@@ -84,17 +84,30 @@ def create_mobile_backend():
     
     print("🚀 Creating mobile backend structure...")
     
+    # Collect every leaf directory and file path up front
+    leaf_dirs = []
+    file_paths = []
     for folder, files in backend_structure.items():
-        Path(folder).mkdir(exist_ok=True)
-        
         if isinstance(files, list):
-            for file in files:
-                create_backend_file(f"{folder}{file}")
+            leaf_dirs.append(folder)
+            file_paths.extend(f"{folder}{file}" for file in files)
         else:
             for subfolder, subfiles in files.items():
-                Path(f"{folder}{subfolder}").mkdir(exist_ok=True)
-                for file in subfiles:
-                    create_backend_file(f"{folder}{subfolder}{file}")
+                leaf_dirs.append(f"{folder}{subfolder}")
+                file_paths.extend(f"{folder}{subfolder}{file}" for file in subfiles)
+    
+    # makedirs creates the parents along the way, so each path is made once
+    for directory in leaf_dirs:
+        os.makedirs(directory, exist_ok=True)
+    
+    for filepath in file_paths:
+        create_backend_file(filepath)
+    
+    # uvicorn[standard] pulls in uvloop and httptools for the servers;
+    # uvloop.run, used by the collector, needs uvloop 0.18
+    for folder in backend_structure:
+        with open(f"{folder}requirements.txt", "w") as f:
+            f.write("fastapi\nuvicorn[standard]\nuvloop>=0.18\nredis>=4.2\norjson\n")
     
     print("✅ Mobile backend structure created!")
 
@@ -108,30 +121,47 @@ Real-time Reddit content collector for mobile app
 Runs continuously and pushes content to user feeds
 """
 import asyncio
-import redis
-from reddit_client import AsyncRedditClient
+from redis.asyncio import Redis
+from reddit_client import AsyncRedditClient, gather_bounded
 from config import MonitoringConfig
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 class MobileRedditCollector:
     def __init__(self):
-        self.redis = redis.Redis()
+        self.redis = Redis()
         
     async def collect_continuous(self):
         """Continuously collect Reddit content and push to feeds"""
         while True:
+            queued = []
             async with AsyncRedditClient() as client:
-                for subreddit in MonitoringConfig.ALL_SUBREDDITS:
-                    posts = await client.get_hot_posts(subreddit, limit=10)
-                    
-                    for post in posts:
-                        # Add to processing queue
-                        self.redis.lpush("content_queue", post.to_json())
+                # Fetch every subreddit concurrently instead of one at a time
+                results = await gather_bounded([
+                    client.get_hot_posts(subreddit, limit=10)
+                    for subreddit in MonitoringConfig.ALL_SUBREDDITS
+                ], return_exceptions=True)
+            
+            for posts in results:
+                if isinstance(posts, list):
+                    queued.extend(post.to_json() for post in posts)
+            
+            # Add the whole sweep to the processing queue in one round trip
+            if queued:
+                await self.redis.lpush("content_queue", *queued)
             
             await asyncio.sleep(30)  # Collect every 30 seconds
 
 if __name__ == "__main__":
     collector = MobileRedditCollector()
-    asyncio.run(collector.collect_continuous())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(collector.collect_continuous())
+    else:
+        asyncio.run(collector.collect_continuous())
 '''
     
     elif "websocket_server" in filename:
@@ -141,10 +171,20 @@ WebSocket server for real-time content delivery to mobile apps
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 import asyncio
 import json
-import redis
+import orjson
+from redis.asyncio import ConnectionPool, Redis
 
 app = FastAPI()
-redis_client = redis.Redis()
+
+# One async connection pool shared by every websocket handler
+redis_pool = ConnectionPool.from_url("redis://localhost")
+redis_client = Redis(connection_pool=redis_pool)
+
+# Most feed items coalesced into one websocket frame
+MAX_BATCH = 32
+
+# Seconds each BLPOP waits before checking the client is still connected
+POLL_TIMEOUT = 5
 
 class ConnectionManager:
     def __init__(self):
@@ -161,29 +201,64 @@ class ConnectionManager:
     async def send_personal_message(self, user_id: str, message: dict):
         if user_id in self.active_connections:
             websocket = self.active_connections[user_id]
-            await websocket.send_text(json.dumps(message))
+            # Text frame: the app's onmessage handler JSON.parses event.data
+            await websocket.send_text(orjson.dumps(message).decode())
 
 manager = ConnectionManager()
 
+async def wait_for_disconnect(websocket: WebSocket):
+    """Return once the client closes its side of the websocket"""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
 @app.websocket("/ws/{user_id}")
 async def websocket_endpoint(websocket: WebSocket, user_id: str):
     await manager.connect(websocket, user_id)
+    closed = asyncio.ensure_future(wait_for_disconnect(websocket))
+    feed_key = f"feed:{user_id}"
     
     try:
-        while True:
-            # Check for new content for this user
-            new_content = redis_client.lpop(f"feed:{user_id}")
-            if new_content:
-                content_data = json.loads(new_content)
-                await manager.send_personal_message(user_id, {
-                    "type": "new_content",
-                    "data": content_data
-                })
+        while not closed.done():
+            # Block until new content lands in this user's feed instead of
+            # polling it every second; the finite timeout hands the pooled
+            # connection back regularly so a closed socket is noticed
+            popped = await redis_client.blpop(feed_key, timeout=POLL_TIMEOUT)
+            if popped is None:
+                continue
+            batch = [popped[1]]
+            # Drain whatever else has queued up so a burst goes out as one
+            # frame; LRANGE+LTRIM in one transaction rather than a counted
+            # LPOP, which needs Redis 6.2
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.lrange(feed_key, 0, MAX_BATCH - 2)
+                pipe.ltrim(feed_key, MAX_BATCH - 1, -1)
+                pending, _ = await pipe.execute()
+            batch.extend(pending)
             
-            await asyncio.sleep(1)
+            message = {
+                "type": "new_content",
+                "data": [json.loads(item) for item in batch]
+            }
+            try:
+                if closed.done():
+                    raise WebSocketDisconnect()
+                await manager.send_personal_message(user_id, message)
+            except Exception:
+                # The client went away; put the undelivered items back at the
+                # head of the feed, in order, for its next connection
+                await redis_client.lpush(feed_key, *reversed(batch))
+                break
             
-    except WebSocketDisconnect:
+    finally:
+        closed.cancel()
         manager.disconnect(user_id)
+
+if __name__ == "__main__":
+    import uvicorn
+    # "auto" picks uvloop and httptools when installed
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto")
 '''
     
     elif "mobile_api" in filename:
@@ -193,10 +268,14 @@ REST API endpoints for mobile app
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-import redis
+import json
+from redis.asyncio import ConnectionPool, Redis
 
 app = FastAPI(title="Reddit Insight Mobile API")
-redis_client = redis.Redis()
+
+# One async connection pool shared by every request handler
+redis_pool = ConnectionPool.from_url("redis://localhost")
+redis_client = Redis(connection_pool=redis_pool)
 
 # CORS for mobile app
 app.add_middleware(
@@ -217,7 +296,7 @@ class SwipeEvent(BaseModel):
 async def record_swipe(swipe: SwipeEvent):
     """Record user swipe for personalization"""
     # Store swipe event
-    redis_client.lpush(f"swipes:{swipe.user_id}", swipe.json())
+    await redis_client.lpush(f"swipes:{swipe.user_id}", swipe.json())
     
     # Update personalization algorithm
     await update_user_preferences(swipe.user_id, swipe.content_id, swipe.direction)
@@ -227,7 +306,7 @@ async def record_swipe(swipe: SwipeEvent):
 @app.get("/api/feed/{user_id}")
 async def get_user_feed(user_id: str, limit: int = 20):
     """Get personalized content feed for user"""
-    feed_items = redis_client.lrange(f"feed:{user_id}", 0, limit-1)
+    feed_items = await redis_client.lrange(f"feed:{user_id}", 0, limit-1)
     
     return {
         "feed": [json.loads(item) for item in feed_items],
@@ -287,7 +366,8 @@ const SwipeScreen = () => {
     ws.onmessage = (event) => {
       const data = JSON.parse(event.data);
       if (data.type === 'new_content') {
-        setContent(prev => [data.data, ...prev]);
+        // A frame carries a batch of items, oldest first
+        setContent(prev => [...data.data.reverse(), ...prev]);
       }
     };
     
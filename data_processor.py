@@ -4,48 +4,291 @@ Data Processing and Analysis Module for Reddit Posts
 import re
 import json
 import asyncio
-import aiofiles
 from typing import List, Dict, Set, Optional, Tuple
-from collections import defaultdict, Counter
-from datetime import datetime, timezone
+from collections import defaultdict, deque, Counter
+from datetime import datetime
 import time
 import logging
 import os
-from dataclasses import asdict
+import shutil
+
+import numpy as np
 
 from reddit_client import RedditPost
 from config import MonitoringConfig, DataConfig
 
+# Faster JSON encoding when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _encode_json(value) -> bytes:
+    """Serialize one export value as compact JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            value,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(value, default=str, separators=(',', ':')).encode()
+
+def _write_export(path: str, data: Dict):
+    """Stream export data to path one top-level section at a time.
+    
+    Only one section is encoded at once (and one post at a time for list
+    sections), and the file is written via a temp file so readers never see
+    it half-written.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(b'{')
+        for index, (key, value) in enumerate(data.items()):
+            if index:
+                f.write(b',')
+            f.write(_encode_json(str(key)))
+            f.write(b':')
+            if isinstance(value, list):
+                f.write(b'[')
+                for position, item in enumerate(value):
+                    if position:
+                        f.write(b',')
+                    f.write(_encode_json(item))
+                f.write(b']')
+            else:
+                f.write(_encode_json(value))
+        f.write(b'}')
+    os.replace(tmp_path, path)
+
+def _publish_latest(source_path: str, latest_path: str):
+    """Atomically point latest_path at the export already written to source_path"""
+    tmp_path = f"{latest_path}.tmp"
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        os.link(source_path, tmp_path)
+    except OSError:
+        # Filesystem without hard links; copy the finished file instead
+        shutil.copyfile(source_path, tmp_path)
+    os.replace(tmp_path, latest_path)
+
+# Patterns are compiled once per process and shared by every DataProcessor
+_TICKER_RE = re.compile(r'\$([A-Z]{1,5})\b')
+
+# Every keyword list the processor checks, scanned together in one pass.
+# Each keyword maps to the lists it belongs to ('moon' is both positive and
+# speculative). Keywords only match at a word start and up to a word end, so
+# 'seller' is not 'sell' and 'give' is not 'iv'; the inflected forms listed
+# in _KEYWORD_INFLECTIONS count as their base keyword.
+_KEYWORD_LISTS = {
+    'positive': ['buy', 'bull', 'moon', 'rocket', 'strong', 'growth', 'profit'],
+    'negative': ['sell', 'bear', 'crash', 'dump', 'loss', 'decline', 'drop'],
+    'speculative': [keyword.lower() for keyword in MonitoringConfig.SPECULATIVE_KEYWORDS],
+    'options': ['calls', 'puts', 'strike', 'expiry', 'iv', 'theta']
+}
+
+# Optional suffixes accepted after a keyword (bullish, buying, dumped, losses)
+_KEYWORD_INFLECTIONS = {
+    'buy': ('s', 'ing'),
+    'bull': ('s', 'ish'),
+    'moon': ('s', 'ed', 'ing'),
+    'rocket': ('s', 'ed', 'ing'),
+    'strong': ('er', 'est', 'ly'),
+    'profit': ('s', 'ed', 'ing', 'able'),
+    'sell': ('s', 'ing'),
+    'bear': ('s', 'ish'),
+    'crash': ('es', 'ed', 'ing'),
+    'dump': ('s', 'ed', 'ing'),
+    'loss': ('es',),
+    'decline': ('s', 'd'),
+    'drop': ('s', 'ped', 'ping'),
+    'squeeze': ('s', 'd'),
+    'strike': ('s',),
+}
+
+def _build_keyword_tags() -> Dict[str, frozenset]:
+    """Map each keyword to the names of the lists that contain it"""
+    tags: Dict[str, Set[str]] = defaultdict(set)
+    for tag, keywords in _KEYWORD_LISTS.items():
+        for keyword in keywords:
+            tags[keyword].add(tag)
+    return {keyword: frozenset(names) for keyword, names in tags.items()}
+
+_KEYWORD_TAGS = _build_keyword_tags()
+# Suffixes (including none) a keyword may carry and still count as itself
+_KEYWORD_SUFFIXES = {
+    keyword: frozenset(('',) + _KEYWORD_INFLECTIONS.get(keyword, ()))
+    for keyword in _KEYWORD_TAGS
+}
+# Keyword plus the rest of its word; the suffix is checked against
+# _KEYWORD_SUFFIXES, which is much cheaper than a capture group per keyword
+_KEYWORD_RE = re.compile(r'\b({})(\w*)\b'.format(
+    '|'.join(re.escape(k) for k in sorted(_KEYWORD_TAGS, key=len, reverse=True))
+))
+
+def _engaged_mask(scores: np.ndarray, comments: np.ndarray, created: np.ndarray) -> np.ndarray:
+    """High-engagement recent posts: score > 100, comments > 50, under 6 hours old"""
+    age_hours = (time.time() - created) / 3600
+    return (scores > 100) & (comments > 50) & (age_hours < 6)
+
+# Row layout of PostColumns' backing buffer
+_POST_COLUMNS_DTYPE = np.dtype([
+    ('collected', np.float64),
+    ('created', np.float64),
+    ('scores', np.int64),
+    ('comments', np.int64),
+    # Keyword half of is_speculative_post; it doesn't change as a post ages
+    ('speculative_content', np.bool_),
+])
+
+def _column(name: str) -> property:
+    """View of one PostColumns field over the rows in use"""
+    return property(lambda self: self._rows[name][:len(self.posts)])
+
+class PostColumns:
+    """Buffered posts plus parallel NumPy columns of the fields scanned in bulk.
+    
+    Rows are kept ordered by collection time, so time cutoffs are a binary
+    search and the oldest post is always the first row. The columns share
+    one backing buffer that doubles when full, so appending a batch only
+    writes that batch's rows.
+    """
+    
+    def __init__(self):
+        self.posts: List[RedditPost] = []
+        self._rows = np.empty(0, dtype=_POST_COLUMNS_DTYPE)
+    
+    collected = _column('collected')
+    created = _column('created')
+    scores = _column('scores')
+    comments = _column('comments')
+    speculative_content = _column('speculative_content')
+    
+    def __len__(self) -> int:
+        return len(self.posts)
+    
+    def __iter__(self):
+        return iter(self.posts)
+    
+    def extend(self, posts: List[RedditPost], speculative_content: List[bool]):
+        """Merge a batch of posts into the rows, growing the buffer geometrically"""
+        count = len(posts)
+        if not count:
+            return
+        size = len(self.posts)
+        if size + count > len(self._rows):
+            grown = np.empty(max(size + count, 2 * len(self._rows), 64), dtype=_POST_COLUMNS_DTYPE)
+            grown[:size] = self._rows[:size]
+            self._rows = grown
+        
+        batch = np.empty(count, dtype=_POST_COLUMNS_DTYPE)
+        batch['collected'] = np.fromiter(
+            (post.timestamp_collected for post in posts), dtype=np.float64, count=count)
+        batch['created'] = np.fromiter(
+            (post.created_utc for post in posts), dtype=np.float64, count=count)
+        batch['scores'] = np.fromiter(
+            (post.score for post in posts), dtype=np.int64, count=count)
+        batch['comments'] = np.fromiter(
+            (post.num_comments for post in posts), dtype=np.int64, count=count)
+        batch['speculative_content'] = np.array(speculative_content, dtype=bool)
+        
+        # Only the incoming batch is sorted; it usually is already
+        collected = batch['collected']
+        if np.any(collected[1:] < collected[:-1]):
+            order = np.argsort(collected, kind='stable')
+            batch = batch[order]
+            posts = [posts[i] for i in order]
+        
+        # Existing rows newer than the batch's oldest post form the tail the
+        # batch merges into; normally there are none and the batch is appended
+        start = int(np.searchsorted(self.collected, batch['collected'][0], side='right'))
+        if start == size:
+            self._rows[size:size + count] = batch
+            self.posts.extend(posts)
+            return
+        
+        # Batch rows land after any tail rows with the same or earlier time
+        tail = self._rows[start:size].copy()
+        slots = np.searchsorted(tail['collected'], batch['collected'], side='right') + np.arange(count)
+        from_tail = np.ones(len(tail) + count, dtype=bool)
+        from_tail[slots] = False
+        merged = self._rows[start:size + count]
+        merged[slots] = batch
+        merged[from_tail] = tail
+        
+        tail_posts = iter(self.posts[start:])
+        batch_posts = iter(posts)
+        self.posts[start:] = [
+            next(tail_posts) if is_tail else next(batch_posts) for is_tail in from_tail.tolist()
+        ]
+    
+    def since(self, cutoff: float) -> List[RedditPost]:
+        """Posts collected after cutoff"""
+        return self.posts[np.searchsorted(self.collected, cutoff, side='right'):]
+    
+    def drop_before(self, cutoff: float) -> List[RedditPost]:
+        """Remove posts collected at or before cutoff and return them"""
+        start = int(np.searchsorted(self.collected, cutoff, side='right'))
+        dropped = self.posts[:start]
+        if start:
+            self.posts = self.posts[start:]
+            self._rows[:len(self.posts)] = self._rows[start:start + len(self.posts)]
+        return dropped
+    
+    def speculative_mask(self) -> np.ndarray:
+        """Vectorized is_speculative_post over the whole buffer"""
+        return _engaged_mask(self.scores, self.comments, self.created) | self.speculative_content
+
 class DataProcessor:
     """Process and analyze Reddit posts for insights"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.posts_buffer: List[RedditPost] = []
+        self.posts_buffer = PostColumns()
+        # Keyword half of is_speculative_post per post id, filled by add_posts
+        self._speculative_cache: Dict[str, bool] = {}
         self.ticker_mentions: Counter = Counter()
         self.sentiment_scores: Dict[str, float] = {}
+        # Running bucket counts and sum over sentiment_scores, kept in step by _set_sentiment
+        self._sentiment_buckets: Counter = Counter()
+        self._sentiment_total = 0.0
+        self._sentiment_collected: Dict[str, float] = {}
         self.trending_keywords: Counter = Counter()
         self.subreddit_activity: Dict[str, Dict] = defaultdict(lambda: {
-            'posts': [],
+            'posts': deque(),
             'total_score': 0,
             'total_comments': 0,
             'speculative_count': 0
         })
+        # Lowercased subreddit -> category; the first category listing a subreddit wins
+        self._subreddit_to_category: Dict[str, str] = {}
+        for category, subreddits in MonitoringConfig.SUBREDDITS.items():
+            for subreddit in subreddits:
+                self._subreddit_to_category.setdefault(subreddit.lower(), category)
         
         # Compile regex patterns for better performance
         self._compile_patterns()
         self._ensure_directories()
     
     def _compile_patterns(self):
-        """Compile regex patterns for efficient matching"""
-        self.ticker_pattern = re.compile(r'\$([A-Z]{1,5})\b')
-        self.priority_patterns = [
-            re.compile(pattern) for pattern in MonitoringConfig.PRIORITY_PATTERNS
-        ]
-        self.speculative_pattern = re.compile(
-            '|'.join(MonitoringConfig.SPECULATIVE_KEYWORDS),
-            re.IGNORECASE
-        )
+        """Attach the shared, compiled-once regex patterns"""
+        self.ticker_pattern = _TICKER_RE
+        self.priority_pattern = MonitoringConfig.PRIORITY_RE
+        self.keyword_tags = _KEYWORD_TAGS
+        self.keyword_suffixes = _KEYWORD_SUFFIXES
+        self.keyword_pattern = _KEYWORD_RE
+    
+    def _scan_keywords(self, content_lower: str) -> Dict[str, Set[str]]:
+        """Map each keyword list to the distinct keywords found in lowercased content"""
+        found: Dict[str, Set[str]] = defaultdict(set)
+        for match in self.keyword_pattern.finditer(content_lower):
+            keyword, suffix = match.groups()
+            if suffix not in self.keyword_suffixes[keyword]:
+                continue
+            for tag in self.keyword_tags[keyword]:
+                found[tag].add(keyword)
+        return found
     
     def _ensure_directories(self):
         """Create necessary directories"""
@@ -54,17 +297,28 @@ class DataProcessor:
     
     def add_posts(self, posts: List[RedditPost]):
         """Add posts to the processing buffer"""
-        self.posts_buffer.extend(posts)
+        speculative_content = []
+        # One clock read for the whole batch's post-age checks
+        now = time.time()
         
-        # Process posts for immediate insights
+        # Process posts for immediate insights, building each case-folded
+        # copy of the content once and sharing it between the analyzers
         for post in posts:
-            self._extract_tickers(post)
-            self._analyze_sentiment(post)
-            self._update_subreddit_activity(post)
+            content = f"{post.title} {post.selftext}"
+            content_lower = content.lower()
+            keywords = self._scan_keywords(content_lower)
+            self._extract_tickers(post, content.upper())
+            self._analyze_sentiment(post, content_lower, keywords)
+            self._update_subreddit_activity(post, keywords, now)
+            has_content = bool(keywords['speculative'] or keywords['options'])
+            self._speculative_cache[post.id] = has_content
+            speculative_content.append(has_content)
+        
+        self.posts_buffer.extend(posts, speculative_content)
     
-    def _extract_tickers(self, post: RedditPost):
+    def _extract_tickers(self, post: RedditPost, content_upper: Optional[str] = None):
         """Extract stock tickers from post content"""
-        content = f"{post.title} {post.selftext}".upper()
+        content = content_upper if content_upper is not None else f"{post.title} {post.selftext}".upper()
         tickers = self.ticker_pattern.findall(content)
         
         for ticker in tickers:
@@ -72,84 +326,129 @@ class DataProcessor:
                 self.ticker_mentions[ticker] += 1
                 self.logger.debug(f"Ticker ${ticker} mentioned in r/{post.subreddit}")
     
-    def _analyze_sentiment(self, post: RedditPost):
+    def _analyze_sentiment(self, post: RedditPost, content_lower: Optional[str] = None,
+                           keywords: Optional[Dict[str, Set[str]]] = None):
         """Basic sentiment analysis based on keywords"""
-        content = f"{post.title} {post.selftext}".lower()
+        content = content_lower if content_lower is not None else f"{post.title} {post.selftext}".lower()
+        if keywords is None:
+            keywords = self._scan_keywords(content)
         
         # Simple sentiment scoring
-        positive_words = ['buy', 'bull', 'moon', 'rocket', 'strong', 'growth', 'profit']
-        negative_words = ['sell', 'bear', 'crash', 'dump', 'loss', 'decline', 'drop']
-        
-        positive_score = sum(1 for word in positive_words if word in content)
-        negative_score = sum(1 for word in negative_words if word in content)
+        positive_score = len(keywords['positive'])
+        negative_score = len(keywords['negative'])
         
         # Normalize score (-1 to 1)
         total_words = len(content.split())
         if total_words > 0:
             sentiment = (positive_score - negative_score) / max(total_words / 10, 1)
-            self.sentiment_scores[post.id] = max(-1, min(1, sentiment))
+            self._set_sentiment(post, max(-1, min(1, sentiment)))
+    
+    @staticmethod
+    def _sentiment_bucket(score: float) -> str:
+        if score > 0.1:
+            return 'positive'
+        if score < -0.1:
+            return 'negative'
+        return 'neutral'
+    
+    def _set_sentiment(self, post: RedditPost, score: float):
+        """Record a post's sentiment, replacing any earlier score in the running totals"""
+        self._drop_sentiment(post.id)
+        self.sentiment_scores[post.id] = score
+        self._sentiment_collected[post.id] = post.timestamp_collected
+        self._sentiment_buckets[self._sentiment_bucket(score)] += 1
+        self._sentiment_total += score
     
-    def _update_subreddit_activity(self, post: RedditPost):
+    def _drop_sentiment(self, post_id: str):
+        score = self.sentiment_scores.pop(post_id, None)
+        self._sentiment_collected.pop(post_id, None)
+        if score is not None:
+            self._sentiment_buckets[self._sentiment_bucket(score)] -= 1
+            self._sentiment_total -= score
+    
+    def _update_subreddit_activity(self, post: RedditPost, keywords: Optional[Dict[str, Set[str]]] = None,
+                                   now: Optional[float] = None):
         """Update activity metrics for subreddit"""
         activity = self.subreddit_activity[post.subreddit]
         activity['posts'].append({
             'id': post.id,
             'score': post.score,
             'comments': post.num_comments,
-            'timestamp': post.created_utc
+            'timestamp': post.created_utc,
+            'collected': post.timestamp_collected
         })
         activity['total_score'] += post.score
         activity['total_comments'] += post.num_comments
         
-        if self.is_speculative_post(post):
+        if self.is_speculative_post(post, keywords, now):
             activity['speculative_count'] += 1
     
-    def is_speculative_post(self, post: RedditPost) -> bool:
+    def is_speculative_post(self, post: RedditPost, keywords: Optional[Dict[str, Set[str]]] = None,
+                            now: Optional[float] = None) -> bool:
         """Determine if a post contains speculative content"""
-        content = f"{post.title} {post.selftext}".lower()
-        
-        # Check for speculative keywords
-        if self.speculative_pattern.search(content):
+        # Keyword hit first: already scanned or cached, so no age check needed
+        if self._has_speculative_content(post, keywords):
             return True
         
         # Check for high score with rapid growth (rising posts with high engagement)
         if post.score > 100 and post.num_comments > 50:
-            post_age_hours = (time.time() - post.created_utc) / 3600
-            if post_age_hours < 6:  # Recent post with high engagement
-                return True
-        
-        # Check for options-related content
-        options_keywords = ['calls', 'puts', 'strike', 'expiry', 'iv', 'theta']
-        if any(keyword in content for keyword in options_keywords):
-            return True
+            if now is None:
+                now = time.time()
+            post_age_hours = (now - post.created_utc) / 3600
+            return post_age_hours < 6  # Recent post with high engagement
         
         return False
     
+    def _has_speculative_content(self, post: RedditPost, keywords: Optional[Dict[str, Set[str]]] = None) -> bool:
+        """Check post text for speculative or options-related keywords"""
+        if keywords is None:
+            cached = self._speculative_cache.get(post.id)
+            if cached is not None:
+                return cached
+            keywords = self._scan_keywords(f"{post.title} {post.selftext}".lower())
+        
+        return bool(keywords['speculative'] or keywords['options'])
+    
+    def speculative_flags(self, posts: List[RedditPost]) -> List[bool]:
+        """Classify a batch of posts, equivalent to is_speculative_post per post.
+        
+        The engagement thresholds are evaluated for the whole batch with NumPy;
+        keyword scanning only runs for posts the numeric check did not flag.
+        """
+        if not posts:
+            return []
+        
+        count = len(posts)
+        scores = np.fromiter((post.score for post in posts), dtype=np.int64, count=count)
+        comments = np.fromiter((post.num_comments for post in posts), dtype=np.int64, count=count)
+        created = np.fromiter((post.created_utc for post in posts), dtype=np.float64, count=count)
+        engaged = _engaged_mask(scores, comments, created)
+        
+        return [
+            bool(hot) or self._has_speculative_content(post)
+            for hot, post in zip(engaged, posts)
+        ]
+    
     def filter_priority_posts(self, posts: List[RedditPost]) -> List[RedditPost]:
         """Filter posts that match priority patterns"""
         priority_posts = []
+        now = time.time()
         
         for post in posts:
-            content = f"{post.title} {post.selftext}"
-            
-            # Check against priority patterns
-            for pattern in self.priority_patterns:
-                if pattern.search(content):
-                    priority_posts.append(post)
-                    break
-            else:
-                # High engagement posts
-                if post.score > 500 or post.num_comments > 200:
-                    priority_posts.append(post)
-                # Rapid growth detection
-                elif self._is_trending_post(post):
-                    priority_posts.append(post)
+            # Cheapest checks first: high engagement, rapid growth, then the
+            # priority pattern union over the post text
+            if (post.score > 500 or post.num_comments > 200
+                    or self._is_trending_post(post, now)
+                    or self.priority_pattern.search(f"{post.title} {post.selftext}")):
+                priority_posts.append(post)
         
         return priority_posts
     
-    def _is_trending_post(self, post: RedditPost) -> bool:
+    def _is_trending_post(self, post: RedditPost, now: Optional[float] = None) -> bool:
         """Detect if a post is trending based on engagement rate"""
-        post_age_hours = (time.time() - post.created_utc) / 3600
+        if now is None:
+            now = time.time()
+        post_age_hours = (now - post.created_utc) / 3600
         
         if post_age_hours < 1:  # Very recent posts
             return post.score > 50 or post.num_comments > 20
@@ -195,10 +494,7 @@ class DataProcessor:
     
     def _get_subreddit_category(self, subreddit: str) -> str:
         """Get category for a subreddit"""
-        for category, subreddits in MonitoringConfig.SUBREDDITS.items():
-            if subreddit.lower() in [s.lower() for s in subreddits]:
-                return category
-        return 'other'
+        return self._subreddit_to_category.get(subreddit.lower(), 'other')
     
     def export_for_analysis(self) -> Dict:
         """Export data in format suitable for upper-level analysis"""
@@ -230,27 +526,30 @@ class DataProcessor:
         cutoff_time = time.time() - (DataConfig.DATA_RETENTION_HOURS * 3600)
         
         # Clean posts buffer
-        self.posts_buffer = [
-            post for post in self.posts_buffer 
-            if post.timestamp_collected > cutoff_time
-        ]
+        for post in self.posts_buffer.drop_before(cutoff_time):
+            self._speculative_cache.pop(post.id, None)
+            # Keep the score if a newer copy of the post is still buffered
+            if self._sentiment_collected.get(post.id) == post.timestamp_collected:
+                self._drop_sentiment(post.id)
         
-        # Clean subreddit activity
-        for subreddit, activity in self.subreddit_activity.items():
-            activity['posts'] = [
-                post for post in activity['posts']
-                if post['timestamp'] > cutoff_time
-            ]
+        # Clean subreddit activity; hot/new/rising batches interleave their
+        # collection times, so expired entries can sit behind fresher ones
+        for activity in self.subreddit_activity.values():
+            posts = activity['posts']
+            if any(entry['collected'] <= cutoff_time for entry in posts):
+                activity['posts'] = deque(
+                    entry for entry in posts if entry['collected'] > cutoff_time
+                )
     
     def _get_recent_priority_posts(self) -> List[Dict]:
         """Get recent high-priority posts"""
         cutoff_time = time.time() - 3600  # Last hour
-        recent_posts = [
-            post for post in self.posts_buffer
-            if post.timestamp_collected > cutoff_time
-        ]
+        recent_posts = self.posts_buffer.since(cutoff_time)
         
-        priority_posts = self.filter_priority_posts(recent_posts)
+        priority_posts = self.filter_priority_posts(recent_posts)[:50]  # Limit to top 50
+        # Keyword flags come from the add_posts cache; only engagement is rechecked
+        speculative = self.speculative_flags(priority_posts)
+        sentiment = self.sentiment_scores.get
         
         return [
             {
@@ -262,10 +561,10 @@ class DataProcessor:
                 'url': post.url,
                 'created_utc': post.created_utc,
                 'category': post.category,
-                'sentiment': self.sentiment_scores.get(post.id, 0),
-                'is_speculative': self.is_speculative_post(post)
+                'sentiment': sentiment(post.id, 0),
+                'is_speculative': is_speculative
             }
-            for post in priority_posts[:50]  # Limit to top 50
+            for post, is_speculative in zip(priority_posts, speculative)
         ]
     
     def _get_sentiment_summary(self) -> Dict:
@@ -273,31 +572,23 @@ class DataProcessor:
         if not self.sentiment_scores:
             return {'average': 0, 'positive': 0, 'negative': 0, 'neutral': 0}
         
-        sentiments = list(self.sentiment_scores.values())
-        positive = len([s for s in sentiments if s > 0.1])
-        negative = len([s for s in sentiments if s < -0.1])
-        neutral = len(sentiments) - positive - negative
-        
+        total = len(self.sentiment_scores)
         return {
-            'average': round(sum(sentiments) / len(sentiments), 3),
-            'positive': positive,
-            'negative': negative,
-            'neutral': neutral,
-            'total': len(sentiments)
+            'average': round(self._sentiment_total / total, 3),
+            'positive': self._sentiment_buckets['positive'],
+            'negative': self._sentiment_buckets['negative'],
+            'neutral': self._sentiment_buckets['neutral'],
+            'total': total
         }
     
     def _get_activity_summary(self) -> Dict:
         """Get overall activity summary"""
         total_posts = len(self.posts_buffer)
-        total_speculative = sum(
-            1 for post in self.posts_buffer 
-            if self.is_speculative_post(post)
-        )
+        total_speculative = int(self.posts_buffer.speculative_mask().sum())
         
         # Calculate posting rate (posts per hour)
-        if self.posts_buffer:
-            oldest_post = min(self.posts_buffer, key=lambda p: p.timestamp_collected)
-            time_span = time.time() - oldest_post.timestamp_collected
+        if total_posts:
+            time_span = time.time() - float(self.posts_buffer.collected[0])
             posting_rate = (total_posts / max(time_span / 3600, 1)) if time_span > 0 else 0
         else:
             posting_rate = 0
@@ -316,16 +607,16 @@ class DataProcessor:
         filepath = os.path.join(DataConfig.EXPORTS_DIR, filename)
         
         try:
-            async with aiofiles.open(filepath, 'w') as f:
-                await f.write(json.dumps(data, indent=2, default=str))
+            # Encoded and written section by section in a worker thread
+            await asyncio.to_thread(_write_export, filepath, data)
             
             self.logger.info(f"Data exported successfully to {filepath}")
             
-            # Also save a latest.json for easy access
+            # Also save a latest.json for easy access, hard-linked to the
+            # dated export rather than written a second time
             latest_path = os.path.join(DataConfig.EXPORTS_DIR, 'latest.json')
-            async with aiofiles.open(latest_path, 'w') as f:
-                await f.write(json.dumps(data, indent=2, default=str))
-                
+            await asyncio.to_thread(_publish_latest, filepath, latest_path)
+            
         except Exception as e:
             self.logger.error(f"Failed to save export data: {e}")
     
@@ -3,41 +3,114 @@
 Comprehensive functionality test for Reddit Data Engine
 """
 
+import asyncio
+import io
+import sys
 import praw
+import asyncpraw
 import os
+import re
 import json
+import string
 import time
 from datetime import datetime
 from dotenv import load_dotenv
-from collections import Counter
+from collections import Counter, namedtuple
 from pathlib import Path
+from contextlib import contextmanager, redirect_stdout
 
 load_dotenv()
 
+# Faster JSON encoding when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Banner lines, built once at import
+BAR = "=" * 60
+DASH = "-" * 60
+ROCKETS = "🚀" * 30
+
+# Compiled once and reused by every run
+TICKER_RE = re.compile(r'\$[A-Z]{1,5}\b')
+
+# Collected post fields; converted to dicts only when exported
+Post = namedtuple('Post', 'id title subreddit score num_comments created_utc author url')
+
+# Sentiment words, matched against whole title tokens
+POSITIVE_WORDS = frozenset(('good', 'great', 'excellent', 'amazing', 'best'))
+NEGATIVE_WORDS = frozenset(('bad', 'terrible', 'worst', 'awful', 'horrible'))
+# Punctuation becomes whitespace so "great!" still tokenizes as "great"
+PUNCTUATION_TO_SPACE = str.maketrans(string.punctuation, ' ' * len(string.punctuation))
+
+# praw.Reddit shared by every FullSystemTest in this process, keyed by credentials
+_REDDIT = None
+_REDDIT_KEY = None
+
+def _get_reddit(client_id, client_secret, user_agent):
+    """Return the shared praw.Reddit, creating it on first use or when credentials change"""
+    global _REDDIT, _REDDIT_KEY
+    key = (client_id, client_secret, user_agent)
+    if _REDDIT is None or _REDDIT_KEY != key:
+        _REDDIT = praw.Reddit(
+            client_id=client_id,
+            client_secret=client_secret,
+            user_agent=user_agent
+        )
+        _REDDIT_KEY = key
+    return _REDDIT
+
+@contextmanager
+def buffered_output():
+    """Collect a phase's prints in memory and emit them with one write"""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
 class FullSystemTest:
     def __init__(self):
         self.client_id = os.getenv('REDDIT_CLIENT_ID')
         self.client_secret = os.getenv('REDDIT_CLIENT_SECRET')
         self.user_agent = os.getenv('REDDIT_USER_AGENT', 'test-script:v1.0')
         self.reddit = None
+        # Subreddit objects resolved on self.reddit, reused across tests
+        self._subs = {}
         self.posts_collected = []
         self.test_results = {}
+        # (post count, score sum, comment sum, subreddits) from the last aggregation
+        self._post_totals = None
         
+    def _aggregate_posts(self):
+        """Score and comment totals plus first-seen subreddits, in one pass over posts_collected"""
+        count = len(self.posts_collected)
+        if self._post_totals is None or self._post_totals[0] != count:
+            score_sum = comments_sum = 0
+            subreddits = {}
+            for post in self.posts_collected:
+                score_sum += post.score
+                comments_sum += post.num_comments
+                subreddits[post.subreddit] = None
+            self._post_totals = (count, score_sum, comments_sum, list(subreddits))
+        return self._post_totals[1:]
+    
     def test_authentication(self):
         """Test 1: Reddit Authentication"""
-        print("\n" + "="*60)
+        print("\n" + BAR)
         print("TEST 1: REDDIT AUTHENTICATION")
-        print("="*60)
+        print(BAR)
         
         try:
-            self.reddit = praw.Reddit(
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                user_agent=self.user_agent
-            )
+            self.reddit = _get_reddit(self.client_id, self.client_secret, self.user_agent)
             
             # Test with a simple subreddit fetch
-            test_sub = self.reddit.subreddit("python")
+            self._subs = {}
+            test_sub = self._sr("python")
             _ = test_sub.display_name
             
             print("✅ Authentication successful")
@@ -48,46 +121,89 @@ class FullSystemTest:
             self.test_results['authentication'] = f'FAILED: {e}'
             return False
     
-    def test_data_collection(self):
+    def _sr(self, name):
+        """Return the cached Subreddit for name, creating it on first use"""
+        subreddit = self._subs.get(name)
+        if subreddit is None:
+            subreddit = self._subs[name] = self.reddit.subreddit(name)
+        return subreddit
+    
+    @staticmethod
+    def _post_record(post, sub_name):
+        """Flatten a listing submission using only the data its listing returned.
+        
+        Fields are read from the instance dict, so a field missing from the
+        listing payload can never trigger a lazy per-post fetch.
+        """
+        data = vars(post)
+        author = data.get('author')
+        return Post(
+            data.get('id'),
+            data.get('title'),
+            sub_name,
+            data.get('score'),
+            data.get('num_comments'),
+            data.get('created_utc'),
+            # Listings carry the author as an unfetched Redditor; its name is local
+            author.name if author else '[deleted]',
+            data.get('url')
+        )
+    
+    async def test_data_collection(self):
         """Test 2: Data Collection from Multiple Subreddits"""
-        print("\n" + "="*60)
+        print("\n" + BAR)
         print("TEST 2: DATA COLLECTION")
-        print("="*60)
+        print(BAR)
         
         test_subreddits = ['python', 'programming', 'technology']
+        combined_name = '+'.join(test_subreddits)
+        
+        async def collect(listing):
+            return [post async for post in listing]
+        
+        async def fetch(reddit):
+            # One multireddit (r/a+b+c) listing per sort covers every subreddit
+            combined = await reddit.subreddit(combined_name)
+            limit = 5 * len(test_subreddits)
+            return await asyncio.gather(
+                collect(combined.hot(limit=limit)),
+                collect(combined.new(limit=limit))
+            )
+        
+        print(f"\nCollecting from r/{combined_name}...")
+        reddit = asyncpraw.Reddit(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            user_agent=self.user_agent
+        )
+        try:
+            hot_all, new_all = await fetch(reddit)
+            print(f"✅ Successfully collected from r/{combined_name}")
+        except Exception as e:
+            print(f"❌ Failed to collect from r/{combined_name}: {e}")
+            self.test_results['collection'] = f'FAILED: {e}'
+            hot_all, new_all = [], []
+        finally:
+            await reddit.close()
+        
+        # Bucket the combined listings back into their subreddits; the
+        # subreddit name comes with each listing item, no extra request
+        hot_by_sub = {sub_name: [] for sub_name in test_subreddits}
+        new_by_sub = {sub_name: [] for sub_name in test_subreddits}
+        for posts, buckets in ((hot_all, hot_by_sub), (new_all, new_by_sub)):
+            for post in posts:
+                bucket = buckets.get(post.subreddit.display_name.lower())
+                if bucket is not None:
+                    bucket.append(post)
         
         for sub_name in test_subreddits:
-            try:
-                print(f"\nCollecting from r/{sub_name}...")
-                subreddit = self.reddit.subreddit(sub_name)
-                
-                # Collect hot posts
-                hot_posts = list(subreddit.hot(limit=5))
-                print(f"  • Hot posts: {len(hot_posts)}")
-                
-                # Collect new posts
-                new_posts = list(subreddit.new(limit=5))
-                print(f"  • New posts: {len(new_posts)}")
-                
-                # Store for analysis
-                for post in hot_posts[:3]:
-                    self.posts_collected.append({
-                        'id': post.id,
-                        'title': post.title,
-                        'subreddit': sub_name,
-                        'score': post.score,
-                        'num_comments': post.num_comments,
-                        'created_utc': post.created_utc,
-                        'author': str(post.author) if post.author else '[deleted]',
-                        'url': post.url
-                    })
-                
-                print(f"✅ Successfully collected from r/{sub_name}")
-                
-            except Exception as e:
-                print(f"❌ Failed to collect from r/{sub_name}: {e}")
-                self.test_results[f'collection_{sub_name}'] = f'FAILED: {e}'
-                continue
+            hot_posts = hot_by_sub[sub_name]
+            print(f"\nr/{sub_name}:")
+            print(f"  • Hot posts: {len(hot_posts)}")
+            print(f"  • New posts: {len(new_by_sub[sub_name])}")
+            
+            # Store for analysis
+            self.posts_collected.extend(self._post_record(post, sub_name) for post in hot_posts[:3])
         
         total_collected = len(self.posts_collected)
         print(f"\n📊 Total posts collected: {total_collected}")
@@ -96,9 +212,9 @@ class FullSystemTest:
     
     def test_data_processing(self):
         """Test 3: Data Processing and Analysis"""
-        print("\n" + "="*60)
+        print("\n" + BAR)
         print("TEST 3: DATA PROCESSING & ANALYSIS")
-        print("="*60)
+        print(BAR)
         
         if not self.posts_collected:
             print("❌ No data to process")
@@ -107,36 +223,26 @@ class FullSystemTest:
         
         try:
             # Ticker extraction simulation
-            ticker_pattern = r'\$[A-Z]{1,5}\b'
-            import re
-            
             tickers = []
             for post in self.posts_collected:
-                found = re.findall(ticker_pattern, post['title'])
+                found = TICKER_RE.findall(post.title)
                 tickers.extend(found)
             
             ticker_counts = Counter(tickers)
             print(f"\n📈 Tickers found: {dict(ticker_counts) if ticker_counts else 'None'}")
             
-            # Sentiment simulation
-            positive_words = ['good', 'great', 'excellent', 'amazing', 'best']
-            negative_words = ['bad', 'terrible', 'worst', 'awful', 'horrible']
-            
+            # Sentiment simulation: each distinct word counts once per title
             sentiment_score = 0
             for post in self.posts_collected:
-                title_lower = post['title'].lower()
-                for word in positive_words:
-                    if word in title_lower:
-                        sentiment_score += 1
-                for word in negative_words:
-                    if word in title_lower:
-                        sentiment_score -= 1
+                tokens = set(post.title.lower().translate(PUNCTUATION_TO_SPACE).split())
+                sentiment_score += len(tokens & POSITIVE_WORDS) - len(tokens & NEGATIVE_WORDS)
             
             print(f"💭 Sentiment score: {sentiment_score}")
             
             # Engagement metrics
-            avg_score = sum(p['score'] for p in self.posts_collected) / len(self.posts_collected)
-            avg_comments = sum(p['num_comments'] for p in self.posts_collected) / len(self.posts_collected)
+            score_sum, comments_sum, _ = self._aggregate_posts()
+            avg_score = score_sum / len(self.posts_collected)
+            avg_comments = comments_sum / len(self.posts_collected)
             
             print(f"📊 Average score: {avg_score:.1f}")
             print(f"💬 Average comments: {avg_comments:.1f}")
@@ -152,9 +258,9 @@ class FullSystemTest:
     
     def test_data_export(self):
         """Test 4: Data Export to JSON"""
-        print("\n" + "="*60)
+        print("\n" + BAR)
         print("TEST 4: DATA EXPORT")
-        print("="*60)
+        print(BAR)
         
         if not self.posts_collected:
             print("❌ No data to export")
@@ -162,17 +268,21 @@ class FullSystemTest:
             return False
         
         try:
+            # One clock read, so the metadata timestamp matches the filename
+            now = datetime.now()
+            
             # Prepare export data
+            score_sum, _, subreddits = self._aggregate_posts()
             export_data = {
                 'metadata': {
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': now.isoformat(),
                     'total_posts': len(self.posts_collected),
                     'test_run': True
                 },
-                'posts': self.posts_collected[:5],  # Export first 5 posts
+                'posts': [post._asdict() for post in self.posts_collected[:5]],  # Export first 5 posts
                 'statistics': {
-                    'subreddits_monitored': list(set(p['subreddit'] for p in self.posts_collected)),
-                    'average_score': sum(p['score'] for p in self.posts_collected) / len(self.posts_collected)
+                    'subreddits_monitored': list(subreddits),
+                    'average_score': score_sum / len(self.posts_collected)
                 }
             }
             
@@ -180,9 +290,14 @@ class FullSystemTest:
             Path('exports').mkdir(exist_ok=True)
             
             # Export to file
-            filename = f"exports/test_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            filename = f"exports/test_export_{now.strftime('%Y%m%d_%H%M%S')}.json"
+            # Serialize in memory, then write the file in one call
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(export_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(export_data, indent=2).encode('utf-8')
+            with open(filename, 'wb') as f:
+                f.write(payload)
             
             print(f"✅ Data exported to: {filename}")
             print(f"📄 File size: {os.path.getsize(filename)} bytes")
@@ -197,29 +312,37 @@ class FullSystemTest:
     
     def test_monitoring_simulation(self):
         """Test 5: Monitoring Simulation"""
-        print("\n" + "="*60)
+        print("\n" + BAR)
         print("TEST 5: MONITORING SIMULATION")
-        print("="*60)
+        print(BAR)
         
         try:
             print("🔄 Simulating real-time monitoring for 5 seconds...")
             
-            start_time = time.time()
+            clock = time.time
+            deadline = clock() + 5
             posts_found = 0
             
-            while time.time() - start_time < 5:
-                # Simulate checking for new posts
-                subreddit = self.reddit.subreddit('python')
-                new_post = next(subreddit.new(limit=1))
+            # skip_existing drops the backlog the stream would otherwise
+            # replay first, so only posts made during the window count.
+            # pause_after=0 hands back None after every empty poll so the
+            # deadline is still checked when nothing new arrives; PRAW does
+            # not sleep before yielding None, so pause here instead of
+            # re-polling Reddit in a tight loop
+            subreddit = self._sr('python')
+            for new_post in subreddit.stream.submissions(pause_after=0, skip_existing=True):
+                if clock() > deadline:
+                    break
                 
-                if new_post:
-                    posts_found += 1
-                    print(f"  • Found post: {new_post.title[:50]}...")
+                if new_post is None:
+                    time.sleep(min(1, max(0, deadline - clock())))
+                    continue
                 
-                time.sleep(2)
+                posts_found += 1
+                print(f"  • Found post: {new_post.title[:50]}...")
             
             print(f"\n✅ Monitoring simulation complete")
-            print(f"📊 Posts checked: {posts_found}")
+            print(f"📊 New posts seen: {posts_found}")
             
             self.test_results['monitoring'] = 'PASSED'
             return True
@@ -231,43 +354,54 @@ class FullSystemTest:
     
     def run_all_tests(self):
         """Run all tests in sequence"""
-        print("\n" + "🚀"*30)
+        print("\n" + ROCKETS)
         print("  REDDIT DATA ENGINE - FULL SYSTEM TEST")
-        print("🚀"*30)
+        print(ROCKETS)
         
-        # Run tests
-        auth_success = self.test_authentication()
+        # Run tests; each phase's output is flushed in one write when it ends
+        with buffered_output():
+            auth_success = self.test_authentication()
         
         if auth_success:
-            self.test_data_collection()
-            self.test_data_processing()
-            self.test_data_export()
+            with buffered_output():
+                asyncio.run(self.test_data_collection())
+            with buffered_output():
+                self.test_data_processing()
+            with buffered_output():
+                self.test_data_export()
+            # Left unbuffered so posts show up as they are found
             self.test_monitoring_simulation()
         
         # Print summary
-        print("\n" + "="*60)
-        print("TEST SUMMARY")
-        print("="*60)
-        
-        passed = 0
-        failed = 0
-        
-        for test_name, result in self.test_results.items():
-            status = "✅" if "PASSED" in str(result) else "❌"
-            print(f"{status} {test_name}: {result}")
+        with buffered_output():
+            print("\n" + BAR)
+            print("TEST SUMMARY")
+            print(BAR)
+            
+            passed = 0
+            failed = 0
             
-            if "PASSED" in str(result):
-                passed += 1
+            for test_name, result in self.test_results.items():
+                status = "✅" if "PASSED" in str(result) else "❌"
+                print(f"{status} {test_name}: {result}")
+                
+                if "PASSED" in str(result):
+                    passed += 1
+                else:
+                    failed += 1
+            
+            print("\n" + DASH)
+            print(f"TOTAL: {passed} passed, {failed} failed")
+            
+            if failed == 0:
+                print("\n🎉 ALL TESTS PASSED! System is fully functional!")
             else:
-                failed += 1
-        
-        print("\n" + "-"*60)
-        print(f"TOTAL: {passed} passed, {failed} failed")
+                print(f"\n⚠️  {failed} test(s) failed. Please review the errors above.")
         
-        if failed == 0:
-            print("\n🎉 ALL TESTS PASSED! System is fully functional!")
-        else:
-            print(f"\n⚠️  {failed} test(s) failed. Please review the errors above.")
+        # Machine-readable copy of the results for CI, written in one call
+        Path('exports').mkdir(exist_ok=True)
+        with open('exports/summary.json', 'wb') as f:
+            f.write(json.dumps(self.test_results, separators=(',', ':')).encode('utf-8'))
         
         return failed == 0
 
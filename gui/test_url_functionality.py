@@ -3,7 +3,9 @@
 Test URL functionality in both GUI interfaces
 """
 
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path
@@ -11,13 +13,25 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from reddit_client import RedditClient
 
+# Banner lines, built once at import
+BAR = "=" * 60
+DASH = "-" * 50
+
+# Classifies a post URL as external ('http') or Reddit-relative ('reddit')
+URL_KIND = re.compile(r'^(?:(?P<http>https?://)|(?P<reddit>/r/))')
+
+@lru_cache(maxsize=1)
+def _client():
+    """One RedditClient (and its HTTP session) shared by every test here"""
+    return RedditClient()
+
 def test_post_urls():
     """Test that we can get proper URLs from Reddit posts"""
     print("🔗 Testing URL extraction from Reddit posts...")
-    print("-" * 50)
+    print(DASH)
     
     try:
-        client = RedditClient()
+        client = _client()
         posts = client.get_hot_posts('python', limit=3)
         
         for i, post in enumerate(posts, 1):
@@ -25,9 +39,11 @@ def test_post_urls():
             print(f"   URL: {post.url}")
             
             # Check if URL is properly formatted
-            if post.url.startswith('http'):
+            match = URL_KIND.match(post.url)
+            kind = match.lastgroup if match else None
+            if kind == 'http':
                 print("   ✅ Direct URL (external link)")
-            elif post.url.startswith('/r/'):
+            elif kind == 'reddit':
                 full_url = f"https://reddit.com{post.url}"
                 print(f"   ✅ Reddit URL: {full_url}")
             else:
@@ -43,7 +59,7 @@ def test_post_urls():
 def test_gui_url_features():
     """Test GUI URL features"""
     print("\n🎨 GUI URL Features Implemented:")
-    print("-" * 50)
+    print(DASH)
     
     print("Desktop GUI (Tkinter):")
     print("  ✅ Hidden URL column in posts TreeView")
@@ -64,7 +80,7 @@ def test_gui_url_features():
 def test_url_formats():
     """Test different URL formats"""
     print("\n🌐 URL Format Testing:")
-    print("-" * 50)
+    print(DASH)
     
     test_urls = [
         "/r/python/comments/abc123/test_post/",
@@ -74,9 +90,11 @@ def test_url_formats():
     ]
     
     for url in test_urls:
-        if url.startswith('http'):
+        match = URL_KIND.match(url)
+        kind = match.lastgroup if match else None
+        if kind == 'http':
             print(f"✅ External URL: {url}")
-        elif url.startswith('/r/'):
+        elif kind == 'reddit':
             full_url = f"https://reddit.com{url}"
             print(f"✅ Reddit URL: {url} → {full_url}")
         else:
@@ -86,7 +104,7 @@ def test_url_formats():
 
 def main():
     print("🚀 Reddit Data Engine - URL Functionality Test")
-    print("=" * 60)
+    print(BAR)
     
     success = True
     
@@ -102,7 +120,7 @@ def main():
     if not test_url_formats():
         success = False
     
-    print("\n" + "=" * 60)
+    print("\n" + BAR)
     
     if success:
         print("🎉 All URL functionality tests passed!")
@@ -6,24 +6,101 @@ A modern, intuitive interface for monitoring Reddit data in real-time
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
+import tkinter.font as tkfont
 import threading
 import queue
 import json
-import time
+import re
 from datetime import datetime
 from pathlib import Path
 import sys
 import os
 import webbrowser
+from collections import Counter, deque
+
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from reddit_client import RedditClient
+from reddit_client import AsyncRedditClient, gather_bounded
 from data_processor import DataProcessor
 from api_interface import AnalysisAPI
 import asyncio
 
+# Ticker mentions like $AAPL, compiled once for the monitor thread
+TICKER_RE = re.compile(r'\$[A-Z]{1,5}\b')
+
+# Most rows kept in the live posts table
+MAX_POST_ROWS = 100
+
+# Stats refresh interval while posts are arriving, and the ceiling it backs
+# off to when none are. New posts are shown as soon as the monitor thread
+# signals them, so only the stats wait on this timer; the clock has its own.
+ACTIVE_TICK_MS = 1000
+IDLE_TICK_MS = 5000
+
+class TickerColumns:
+    """Ticker mention counts and sentiments as parallel NumPy columns.
+    
+    Each ticker gets a fixed row the first time it is seen; the arrays grow
+    geometrically so adding tickers stays amortized O(1).
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        self.index = {}
+        self.names = []
+        self.counts = np.zeros(capacity, dtype=np.int64)
+        self.sentiments = np.zeros(capacity, dtype=np.float32)
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def add_counts(self, mentions: Counter):
+        """Add a batch of ticker -> mention counts"""
+        for ticker, count in mentions.items():
+            row = self.index.get(ticker)
+            if row is None:
+                row = self._add_row(ticker)
+            self.counts[row] += count
+    
+    def _add_row(self, ticker: str) -> int:
+        row = len(self.names)
+        if row == len(self.counts):
+            capacity = 2 * len(self.counts)
+            self.counts = np.concatenate((self.counts, np.zeros(capacity - row, dtype=self.counts.dtype)))
+            self.sentiments = np.concatenate((self.sentiments, np.zeros(capacity - row, dtype=self.sentiments.dtype)))
+        self.index[ticker] = row
+        self.names.append(ticker)
+        return row
+    
+    def top(self, k: int):
+        """(ticker, count, sentiment) for the k most mentioned tickers.
+        
+        Ties keep first-seen order, matching a stable sort by count.
+        """
+        n = len(self.names)
+        counts = self.counts[:n]
+        if n > k:
+            # Partial selection: everything above the k-th largest count,
+            # then the earliest rows that tie with it
+            threshold = np.partition(counts, n - k)[n - k]
+            above = np.flatnonzero(counts > threshold)
+            ties = np.flatnonzero(counts == threshold)[:k - len(above)]
+            rows = np.concatenate((above, ties))
+            rows.sort()
+        else:
+            rows = np.arange(n)
+        rows = rows[np.argsort(-counts[rows], kind='stable')]
+        return [(self.names[row], int(counts[row]), float(self.sentiments[row])) for row in rows]
+    
+    def to_dict(self):
+        """Plain {ticker: {'count', 'sentiment'}} mapping for JSON export"""
+        return {
+            ticker: {'count': int(self.counts[row]), 'sentiment': float(self.sentiments[row])}
+            for row, ticker in enumerate(self.names)
+        }
+
 class RedditMonitorGUI:
     def __init__(self, root):
         self.root = root
@@ -47,17 +124,45 @@ class RedditMonitorGUI:
             'text_bg': '#1e1e1e'
         }
         
+        # Named fonts, parsed once and shared by every widget that uses them
+        self.fonts = {
+            'title': tkfont.Font(self.root, family='Arial', size=20, weight='bold'),
+            'stat_value': tkfont.Font(self.root, family='Arial', size=18, weight='bold'),
+            'header': tkfont.Font(self.root, family='Arial', size=16, weight='bold'),
+            'section': tkfont.Font(self.root, family='Arial', size=14, weight='bold'),
+            'button': tkfont.Font(self.root, family='Arial', size=12, weight='bold'),
+            'label': tkfont.Font(self.root, family='Arial', size=12),
+            'body': tkfont.Font(self.root, family='Arial', size=11),
+            'small': tkfont.Font(self.root, family='Arial', size=10),
+            'mono': tkfont.Font(self.root, family='Courier', size=11),
+            'mono_small': tkfont.Font(self.root, family='Courier', size=10)
+        }
+        
         # Data storage
         self.posts_queue = queue.Queue()
-        self.tickers_data = {}
+        # (row id, subreddit) per row in the posts table, oldest first; its
+        # length is the row count
+        self._post_rows = deque()
+        # Rows per subreddit currently in the posts table
+        self._sub_counter = Counter()
+        self.tickers_data = TickerColumns()
         self.monitoring_active = False
         self.monitor_thread = None
+        # Consecutive UI ticks with no new posts, and posts drained since the last tick
+        self._idle_ticks = 0
+        self._posts_since_tick = 0
+        # Status-bar message left by the monitor thread for the UI thread to show
+        self._status_message = None
         
         # Setup UI
         self.setup_ui()
         
-        # Start status updates
-        self.update_status()
+        # The monitor thread raises <<NewPosts>> after queueing a batch
+        self.root.bind('<<NewPosts>>', self._drain_posts)
+        
+        # Start the UI refresh loops
+        self._tick()
+        self._tick_clock()
         
     def setup_ui(self):
         """Create the main UI layout"""
@@ -88,7 +193,7 @@ class RedditMonitorGUI:
         title_label = tk.Label(
             toolbar,
             text="🚀 Reddit Data Engine",
-            font=('Arial', 20, 'bold'),
+            font=self.fonts['title'],
             bg=self.colors['card_bg'],
             fg=self.colors['fg']
         )
@@ -101,7 +206,7 @@ class RedditMonitorGUI:
             command=self.start_monitoring,
             bg=self.colors['success'],
             fg='white',
-            font=('Arial', 12, 'bold'),
+            font=self.fonts['button'],
             padx=20,
             pady=8,
             relief=tk.FLAT,
@@ -115,7 +220,7 @@ class RedditMonitorGUI:
             command=self.stop_monitoring,
             bg=self.colors['error'],
             fg='white',
-            font=('Arial', 12, 'bold'),
+            font=self.fonts['button'],
             padx=20,
             pady=8,
             relief=tk.FLAT,
@@ -131,7 +236,7 @@ class RedditMonitorGUI:
             command=self.refresh_data,
             bg=self.colors['accent'],
             fg='white',
-            font=('Arial', 12),
+            font=self.fonts['label'],
             padx=15,
             pady=8,
             relief=tk.FLAT,
@@ -143,7 +248,7 @@ class RedditMonitorGUI:
         self.conn_label = tk.Label(
             toolbar,
             text="⚫ Disconnected",
-            font=('Arial', 11),
+            font=self.fonts['body'],
             bg=self.colors['card_bg'],
             fg=self.colors['warning']
         )
@@ -165,7 +270,7 @@ class RedditMonitorGUI:
         feed_label = tk.Label(
             left_panel,
             text="Live Reddit Feed",
-            font=('Arial', 14, 'bold'),
+            font=self.fonts['section'],
             bg=self.colors['bg'],
             fg=self.colors['fg']
         )
@@ -209,7 +314,7 @@ class RedditMonitorGUI:
         stats_label = tk.Label(
             parent,
             text="📈 Live Statistics",
-            font=('Arial', 14, 'bold'),
+            font=self.fonts['section'],
             bg=self.colors['bg'],
             fg=self.colors['fg']
         )
@@ -242,7 +347,7 @@ class RedditMonitorGUI:
         title_label = tk.Label(
             card,
             text=title,
-            font=('Arial', 10),
+            font=self.fonts['small'],
             bg=self.colors['card_bg'],
             fg=self.colors['fg']
         )
@@ -251,7 +356,7 @@ class RedditMonitorGUI:
         value_label = tk.Label(
             card,
             text=value,
-            font=('Arial', 18, 'bold'),
+            font=self.fonts['stat_value'],
             bg=self.colors['card_bg'],
             fg=color
         )
@@ -274,7 +379,7 @@ class RedditMonitorGUI:
         tk.Label(
             header_frame,
             text="Trending Stock Tickers",
-            font=('Arial', 16, 'bold'),
+            font=self.fonts['header'],
             bg=self.colors['bg'],
             fg=self.colors['fg']
         ).pack(side=tk.LEFT)
@@ -309,7 +414,7 @@ class RedditMonitorGUI:
         self.insights_text = scrolledtext.ScrolledText(
             insights_frame,
             wrap=tk.WORD,
-            font=('Courier', 11),
+            font=self.fonts['mono'],
             bg=self.colors['text_bg'],
             fg=self.colors['fg'],
             insertbackground=self.colors['fg']
@@ -326,7 +431,7 @@ class RedditMonitorGUI:
             command=self.generate_insights,
             bg=self.colors['accent'],
             fg='white',
-            font=('Arial', 11),
+            font=self.fonts['body'],
             padx=15,
             pady=5,
             relief=tk.FLAT,
@@ -339,7 +444,7 @@ class RedditMonitorGUI:
             command=lambda: self.insights_text.delete(1.0, tk.END),
             bg=self.colors['card_bg'],
             fg=self.colors['fg'],
-            font=('Arial', 11),
+            font=self.fonts['body'],
             padx=15,
             pady=5,
             relief=tk.FLAT,
@@ -358,7 +463,7 @@ class RedditMonitorGUI:
         tk.Label(
             options_frame,
             text="Export Options",
-            font=('Arial', 14, 'bold'),
+            font=self.fonts['section'],
             bg=self.colors['card_bg'],
             fg=self.colors['fg']
         ).grid(row=0, column=0, columnspan=2, pady=10)
@@ -367,14 +472,14 @@ class RedditMonitorGUI:
         tk.Label(
             options_frame,
             text="Subreddits:",
-            font=('Arial', 11),
+            font=self.fonts['body'],
             bg=self.colors['card_bg'],
             fg=self.colors['fg']
         ).grid(row=1, column=0, sticky='e', padx=10, pady=5)
         
         self.export_subs = tk.Entry(
             options_frame,
-            font=('Arial', 11),
+            font=self.fonts['body'],
             bg=self.colors['text_bg'],
             fg=self.colors['fg'],
             insertbackground=self.colors['fg'],
@@ -387,7 +492,7 @@ class RedditMonitorGUI:
         tk.Label(
             options_frame,
             text="Hours back:",
-            font=('Arial', 11),
+            font=self.fonts['body'],
             bg=self.colors['card_bg'],
             fg=self.colors['fg']
         ).grid(row=2, column=0, sticky='e', padx=10, pady=5)
@@ -396,7 +501,7 @@ class RedditMonitorGUI:
             options_frame,
             from_=1,
             to=168,
-            font=('Arial', 11),
+            font=self.fonts['body'],
             bg=self.colors['text_bg'],
             fg=self.colors['fg'],
             width=10
@@ -412,7 +517,7 @@ class RedditMonitorGUI:
             command=self.export_data,
             bg=self.colors['success'],
             fg='white',
-            font=('Arial', 12, 'bold'),
+            font=self.fonts['button'],
             padx=20,
             pady=8,
             relief=tk.FLAT,
@@ -423,7 +528,7 @@ class RedditMonitorGUI:
         tk.Label(
             export_frame,
             text="Export Log",
-            font=('Arial', 12, 'bold'),
+            font=self.fonts['button'],
             bg=self.colors['bg'],
             fg=self.colors['fg']
         ).pack(pady=5)
@@ -432,7 +537,7 @@ class RedditMonitorGUI:
             export_frame,
             wrap=tk.WORD,
             height=15,
-            font=('Courier', 10),
+            font=self.fonts['mono_small'],
             bg=self.colors['text_bg'],
             fg=self.colors['fg']
         )
@@ -450,7 +555,7 @@ class RedditMonitorGUI:
         tk.Label(
             container,
             text="Monitoring Settings",
-            font=('Arial', 14, 'bold'),
+            font=self.fonts['section'],
             bg=self.colors['card_bg'],
             fg=self.colors['fg']
         ).grid(row=0, column=0, columnspan=2, pady=10)
@@ -459,7 +564,7 @@ class RedditMonitorGUI:
         tk.Label(
             container,
             text="Refresh Interval (seconds):",
-            font=('Arial', 11),
+            font=self.fonts['body'],
             bg=self.colors['card_bg'],
             fg=self.colors['fg']
         ).grid(row=1, column=0, sticky='e', padx=10, pady=5)
@@ -480,7 +585,7 @@ class RedditMonitorGUI:
         tk.Label(
             container,
             text="Max Posts per Subreddit:",
-            font=('Arial', 11),
+            font=self.fonts['body'],
             bg=self.colors['card_bg'],
             fg=self.colors['fg']
         ).grid(row=2, column=0, sticky='e', padx=10, pady=5)
@@ -501,7 +606,7 @@ class RedditMonitorGUI:
         tk.Label(
             container,
             text="Monitored Subreddits:",
-            font=('Arial', 11),
+            font=self.fonts['body'],
             bg=self.colors['card_bg'],
             fg=self.colors['fg']
         ).grid(row=3, column=0, sticky='ne', padx=10, pady=5)
@@ -510,7 +615,7 @@ class RedditMonitorGUI:
             container,
             height=10,
             width=40,
-            font=('Arial', 10),
+            font=self.fonts['small'],
             bg=self.colors['text_bg'],
             fg=self.colors['fg']
         )
@@ -537,7 +642,7 @@ class RedditMonitorGUI:
             command=self.save_settings,
             bg=self.colors['success'],
             fg='white',
-            font=('Arial', 11),
+            font=self.fonts['body'],
             padx=15,
             pady=5,
             relief=tk.FLAT,
@@ -552,7 +657,7 @@ class RedditMonitorGUI:
         self.status_label = tk.Label(
             status_bar,
             text="Ready",
-            font=('Arial', 10),
+            font=self.fonts['small'],
             bg=self.colors['card_bg'],
             fg=self.colors['fg'],
             anchor='w'
@@ -562,19 +667,41 @@ class RedditMonitorGUI:
         self.time_label = tk.Label(
             status_bar,
             text="",
-            font=('Arial', 10),
+            font=self.fonts['small'],
             bg=self.colors['card_bg'],
             fg=self.colors['fg']
         )
         self.time_label.pack(side=tk.RIGHT, padx=10)
-        
+    
+    def _tick(self):
+        """UI refresh loop for the statistics, backing off while idle"""
+        if self._status_message:
+            self.status_label.config(text=self._status_message)
+            self._status_message = None
+        # Fallback for posts whose <<NewPosts>> notification never arrived
+        if not self.posts_queue.empty():
+            self._drain_posts()
+        else:
+            self.update_status()
+        if self._posts_since_tick:
+            self._posts_since_tick = 0
+            self._idle_ticks = 0
+            interval = ACTIVE_TICK_MS
+        else:
+            # Back off gradually while nothing is arriving
+            self._idle_ticks += 1
+            interval = min(IDLE_TICK_MS, ACTIVE_TICK_MS + self._idle_ticks * 500)
+        self.root.after(interval, self._tick)
+    
+    def _tick_clock(self):
+        """Update the clock on each second boundary, independent of _tick's back-off"""
         self.update_time()
+        self.root.after(1000 - datetime.now().microsecond // 1000, self._tick_clock)
     
     def update_time(self):
         """Update time display"""
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.time_label.config(text=current_time)
-        self.root.after(1000, self.update_time)
     
     def start_monitoring(self):
         """Start monitoring Reddit"""
@@ -605,98 +732,115 @@ class RedditMonitorGUI:
     def monitor_reddit(self):
         """Background thread for monitoring Reddit"""
         try:
-            client = RedditClient()
-            
-            # Get subreddits from settings
-            subreddits = self.subreddits_text.get(1.0, tk.END).strip().split('\n')
-            subreddits = [s.strip() for s in subreddits if s.strip()]
-            
-            while self.monitoring_active:
-                for subreddit in subreddits:
-                    if not self.monitoring_active:
-                        break
-                    
-                    try:
-                        # Fetch hot posts
-                        posts = client.get_hot_posts(subreddit, limit=5)
-                        
-                        for post in posts:
-                            # Add to queue for UI update
-                            self.posts_queue.put({
-                                'time': datetime.now().strftime("%H:%M:%S"),
-                                'subreddit': post.subreddit,
-                                'title': post.title[:80] + '...' if len(post.title) > 80 else post.title,
-                                'score': post.score,
-                                'comments': post.num_comments,
-                                'url': f"https://reddit.com{post.url}" if not post.url.startswith('http') else post.url
-                            })
-                            
-                            # Extract tickers
-                            import re
-                            tickers = re.findall(r'\$[A-Z]{1,5}\b', post.title)
-                            for ticker in tickers:
-                                if ticker not in self.tickers_data:
-                                    self.tickers_data[ticker] = {'count': 0, 'sentiment': 0}
-                                self.tickers_data[ticker]['count'] += 1
-                        
-                    except Exception as e:
-                        print(f"Error monitoring {subreddit}: {e}")
-                
-                # Wait before next iteration
-                time.sleep(self.refresh_interval.get())
-                
+            asyncio.run(self._monitor_async())
         except Exception as e:
             print(f"Monitor thread error: {e}")
             self.monitoring_active = False
     
-    def update_status(self):
-        """Update UI with new data"""
-        # Process posts queue
-        posts_added = 0
-        while not self.posts_queue.empty() and posts_added < 10:
-            try:
-                post_data = self.posts_queue.get_nowait()
+    async def _monitor_async(self):
+        """Fetch every subreddit concurrently each refresh cycle"""
+        # Get subreddits from settings
+        subreddits = self.subreddits_text.get(1.0, tk.END).strip().split('\n')
+        subreddits = [s.strip() for s in subreddits if s.strip()]
+        
+        async with AsyncRedditClient() as client:
+            while self.monitoring_active:
+                # Fetch hot posts
+                results = await gather_bounded([
+                    client.get_hot_posts(subreddit, limit=5)
+                    for subreddit in subreddits
+                ], return_exceptions=True)
+                
+                if not self.monitoring_active:
+                    break
                 
-                # Add to treeview (newest first)
-                self.posts_tree.insert('', 0, values=(
-                    post_data['time'],
-                    post_data['subreddit'],
-                    post_data['title'],
-                    post_data['score'],
-                    post_data['comments'],
-                    post_data.get('url', '')  # URL in hidden column
-                ))
+                titles = []
+                for subreddit, posts in zip(subreddits, results):
+                    if isinstance(posts, Exception):
+                        print(f"Error monitoring {subreddit}: {posts}")
+                        continue
+                    
+                    for post in posts:
+                        # Add to queue for UI update
+                        self.posts_queue.put({
+                            'time': datetime.now().strftime("%H:%M:%S"),
+                            'subreddit': post.subreddit,
+                            'title': post.title[:80] + '...' if len(post.title) > 80 else post.title,
+                            'score': post.score,
+                            'comments': post.num_comments,
+                            'url': f"https://reddit.com{post.url}" if not post.url.startswith('http') else post.url
+                        })
+                        titles.append(post.title)
                 
-                # Limit displayed posts
-                if len(self.posts_tree.get_children()) > 100:
-                    self.posts_tree.delete(self.posts_tree.get_children()[-1])
+                # Extract tickers from the whole cycle's titles in one scan;
+                # the newline separator can't be part of a ticker match
+                self.tickers_data.add_counts(Counter(TICKER_RE.findall('\n'.join(titles))))
                 
-                posts_added += 1
+                # Wake the UI thread to drain this cycle's posts
+                if titles:
+                    try:
+                        self.root.event_generate('<<NewPosts>>', when='tail')
+                    except (tk.TclError, RuntimeError) as e:
+                        # _tick still drains the queue; widgets can only be
+                        # touched from the UI thread, so leave it the message
+                        self._status_message = f"Live updates delayed: {e}"
                 
+                # Wait before next iteration
+                await asyncio.sleep(self.refresh_interval.get())
+    
+    def _drain_posts(self, event=None):
+        """Move queued posts into the posts table (runs on <<NewPosts>>)"""
+        # Drain everything queued since the last notification
+        pending = []
+        while True:
+            try:
+                pending.append(self.posts_queue.get_nowait())
             except queue.Empty:
                 break
         
+        # Only the newest rows could survive the cap, so skip the rest
+        for post_data in pending[-MAX_POST_ROWS:]:
+            # Add to treeview (newest first)
+            row_id = self.posts_tree.insert('', 0, values=(
+                post_data['time'],
+                post_data['subreddit'],
+                post_data['title'],
+                post_data['score'],
+                post_data['comments'],
+                post_data.get('url', '')  # URL in hidden column
+            ))
+            self._post_rows.append((row_id, post_data['subreddit']))
+            self._sub_counter[post_data['subreddit']] += 1
+        
+        # Limit displayed posts, evicting the oldest rows in one call
+        evicted = []
+        while len(self._post_rows) > MAX_POST_ROWS:
+            row_id, subreddit = self._post_rows.popleft()
+            evicted.append(row_id)
+            self._sub_counter[subreddit] -= 1
+            if not self._sub_counter[subreddit]:
+                del self._sub_counter[subreddit]
+        if evicted:
+            self.posts_tree.delete(*evicted)
+        
+        self._posts_since_tick += len(pending)
+        self.update_status()
+    
+    def update_status(self):
+        """Refresh statistics and the tickers tab"""
         # Update statistics
         if hasattr(self, 'stat_cards'):
-            total_posts = len(self.posts_tree.get_children())
+            total_posts = len(self._post_rows)
             self.stat_cards['Total Posts'].config(text=str(total_posts))
             
-            # Count unique subreddits
-            subreddits = set()
-            for item in self.posts_tree.get_children():
-                values = self.posts_tree.item(item)['values']
-                if values:
-                    subreddits.add(values[1])
-            self.stat_cards['Active Subreddits'].config(text=str(len(subreddits)))
+            # Unique subreddits among the displayed rows
+            self.stat_cards['Active Subreddits'].config(text=str(len(self._sub_counter)))
             
             # Update tickers count
             self.stat_cards['Trending Tickers'].config(text=str(len(self.tickers_data)))
         
         # Update tickers tab
         self.update_tickers_display()
-        
-        # Schedule next update
-        self.root.after(1000, self.update_status)
     
     def update_tickers_display(self):
         """Update tickers treeview"""
@@ -705,13 +849,11 @@ class RedditMonitorGUI:
             self.tickers_tree.delete(item)
         
         # Add tickers sorted by mentions
-        sorted_tickers = sorted(self.tickers_data.items(), key=lambda x: x[1]['count'], reverse=True)
-        
-        for ticker, data in sorted_tickers[:20]:  # Top 20
-            sentiment = "Bullish" if data['sentiment'] > 0 else "Neutral"
+        for ticker, count, sentiment_score in self.tickers_data.top(20):  # Top 20
+            sentiment = "Bullish" if sentiment_score > 0 else "Neutral"
             self.tickers_tree.insert('', tk.END, values=(
                 ticker,
-                data['count'],
+                count,
                 sentiment,
                 "WSB",  # Placeholder
                 "↑"  # Placeholder trend
@@ -721,8 +863,9 @@ class RedditMonitorGUI:
         """Refresh current data"""
         self.status_label.config(text="Refreshing data...")
         # Clear and reload
-        for item in self.posts_tree.get_children():
-            self.posts_tree.delete(item)
+        self.posts_tree.delete(*self.posts_tree.get_children())
+        self._post_rows.clear()
+        self._sub_counter.clear()
         self.status_label.config(text="Data refreshed")
     
     def generate_insights(self):
@@ -739,9 +882,8 @@ class RedditMonitorGUI:
         # Top tickers
         if self.tickers_data:
             self.insights_text.insert(tk.END, "🔥 TOP TRENDING TICKERS\n")
-            sorted_tickers = sorted(self.tickers_data.items(), key=lambda x: x[1]['count'], reverse=True)
-            for ticker, data in sorted_tickers[:5]:
-                self.insights_text.insert(tk.END, f"  {ticker}: {data['count']} mentions\n")
+            for ticker, count, _ in self.tickers_data.top(5):
+                self.insights_text.insert(tk.END, f"  {ticker}: {count} mentions\n")
             self.insights_text.insert(tk.END, "\n")
         
         # Market sentiment
@@ -772,7 +914,7 @@ class RedditMonitorGUI:
                     'hours_back': hours
                 },
                 'posts': [],
-                'tickers': self.tickers_data,
+                'tickers': self.tickers_data.to_dict(),
                 'statistics': {
                     'total_posts': len(self.posts_tree.get_children()),
                     'unique_tickers': len(self.tickers_data)
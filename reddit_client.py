@@ -4,7 +4,7 @@ Reddit API Client for data collection
 import praw
 import asyncpraw
 import asyncio
-from typing import List, Dict, Optional, AsyncGenerator
+from typing import Awaitable, List, Dict, Optional, AsyncGenerator
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 import logging
@@ -14,6 +14,14 @@ from config import RedditConfig, MonitoringConfig
 @dataclass
 class RedditPost:
     """Structured representation of a Reddit post"""
+    # Slotted instances: faster attribute access and no per-post __dict__
+    # (declared by hand since dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        'id', 'title', 'author', 'subreddit', 'score', 'upvote_ratio',
+        'num_comments', 'created_utc', 'url', 'selftext', 'flair', 'stickied',
+        'over_18', 'category', 'timestamp_collected'
+    )
+    
     id: str
     title: str
     author: str
@@ -42,6 +50,22 @@ class RedditPost:
         """Check if post meets minimum engagement criteria"""
         return self.score >= min_score and self.num_comments >= min_comments
 
+async def gather_bounded(coros: List[Awaitable], limit: Optional[int] = None,
+                         return_exceptions: bool = False) -> list:
+    """asyncio.gather with at most limit awaitables in flight at once.
+    
+    Defaults to MonitoringConfig.MAX_CONCURRENT_FETCHES so sweeps over many
+    subreddits stay within Reddit's rate limits.
+    """
+    semaphore = asyncio.Semaphore(limit or MonitoringConfig.MAX_CONCURRENT_FETCHES)
+    
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*[bounded(coro) for coro in coros],
+                                return_exceptions=return_exceptions)
+
 class RedditClient:
     """Synchronous Reddit client for basic operations"""
     
@@ -234,10 +234,13 @@ async def generate_personalized_content(
         # AI processing
         if all_posts:
             summarizer = ContentSummarizer()
-            processed_content = await batch_summarize(
-                [post.to_dict() for post in all_posts], 
-                summarizer
-            )
+            try:
+                processed_content = await batch_summarize(
+                    [post.to_dict() for post in all_posts], 
+                    summarizer
+                )
+            finally:
+                await summarizer.close()
             
             # Convert to API format
             formatted_content = []
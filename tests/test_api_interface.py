@@ -8,7 +8,7 @@ from unittest.mock import patch, MagicMock, AsyncMock
 import tempfile
 import os
 
-from api_interface import AnalysisAPI, SimpleAPI, get_reddit_insights
+from api_interface import AnalysisAPI, SimpleAPI, get_reddit_insights, classify_mood
 from reddit_client import RedditPost
 import time
 
@@ -85,11 +85,14 @@ class TestAnalysisAPI:
         """Create mock latest.json file"""
         from config import DataConfig
         
-        latest_path = os.path.join(DataConfig.EXPORTS_DIR, 'latest.json')
+        # Point the API at the temp directory rather than the real exports/
+        exports_dir = os.path.join(temp_data_dir, 'exports')
+        latest_path = os.path.join(exports_dir, 'latest.json')
         with open(latest_path, 'w') as f:
             json.dump(sample_export_data, f)
         
-        return latest_path
+        with patch.object(DataConfig, 'EXPORTS_DIR', exports_dir):
+            yield latest_path
     
     @pytest.mark.asyncio
     async def test_get_latest_data(self, mock_latest_file, sample_export_data):
@@ -102,6 +105,45 @@ class TestAnalysisAPI:
         assert data["metadata"]["total_posts"] == 100
         assert "AAPL" in data["trending_tickers"]
     
+    @pytest.mark.asyncio
+    async def test_get_latest_data_cached(self, mock_latest_file, sample_export_data):
+        """Test latest data is reused until the file changes"""
+        api = AnalysisAPI()
+        
+        first = await api.get_latest_data()
+        second = await api.get_latest_data()
+        assert first is second
+        
+        # Rewrite the file with a newer mtime
+        sample_export_data["metadata"]["total_posts"] = 200
+        with open(mock_latest_file, 'w') as f:
+            json.dump(sample_export_data, f)
+        stat = os.stat(mock_latest_file)
+        os.utime(mock_latest_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        updated = await api.get_latest_data()
+        assert updated is not first
+        assert updated["metadata"]["total_posts"] == 200
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_getters_share_one_read(self, mock_latest_file):
+        """Test concurrent getters decode latest.json only once"""
+        api = AnalysisAPI()
+        
+        with patch('api_interface._json_loads', wraps=json.loads) as mock_loads:
+            trending, sentiment, signals, posts = await asyncio.gather(
+                api.get_trending_tickers(10),
+                api.get_sentiment_overview(),
+                api.get_speculative_signals(),
+                api.get_priority_posts(limit=10)
+            )
+        
+        assert mock_loads.call_count == 1
+        assert trending[0]["ticker"] == "AAPL"
+        assert sentiment["mood"] == "neutral"
+        assert signals["speculative_ratio"] == 0.3
+        assert len(posts) == 2
+    
     @pytest.mark.asyncio
     async def test_get_latest_data_no_file(self, temp_data_dir):
         """Test getting latest data when no file exists"""
@@ -144,6 +186,18 @@ class TestAnalysisAPI:
         empty_activity = await api.get_subreddit_activity("nonexistent")
         assert empty_activity == {}
     
+    @pytest.mark.asyncio
+    async def test_get_subreddit_activity_reuses_insights(self, mock_latest_file):
+        """Test repeated subreddit lookups reuse one decoded insights dict"""
+        api = AnalysisAPI()
+        
+        with patch('api_interface._json_loads', wraps=json.loads) as mock_loads:
+            all_activity = await api.get_subreddit_activity()
+            for name in ["wallstreetbets", "stocks"] * 3:
+                assert await api.get_subreddit_activity(name) is all_activity[name]
+        
+        assert mock_loads.call_count == 1
+    
     @pytest.mark.asyncio
     async def test_get_priority_posts(self, mock_latest_file):
         """Test getting priority posts"""
@@ -188,13 +242,22 @@ class TestAnalysisAPI:
         assert sentiment["mood"] == "neutral"  # 0.15 is between -0.2 and 0.2
         assert sentiment["confidence"] == 0.15
     
+    def test_classify_mood(self):
+        """Test vectorized mood classification"""
+        moods = classify_mood([0.5, -0.5, 0.15, 0.2, -0.2, -0.21])
+        
+        assert list(moods) == ["bullish", "bearish", "neutral", "neutral", "neutral", "bearish"]
+    
     @pytest.mark.asyncio
     async def test_get_real_time_feed(self):
         """Test getting real-time feed"""
         api = AnalysisAPI()
         
-        # Mock the sync client
-        with patch.object(api, 'sync_client') as mock_client:
+        # Mock async client
+        with patch('api_interface.AsyncRedditClient') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+            
             mock_posts = [
                 RedditPost(
                     id="rt1",
@@ -232,7 +295,11 @@ class TestAnalysisAPI:
                 )
             ]
             
-            mock_client.get_hot_posts.return_value = mock_posts
+            # Each subreddit's fetch returns only its own posts
+            posts_by_subreddit = {post.subreddit: [post] for post in mock_posts}
+            mock_client.get_hot_posts.side_effect = (
+                lambda subreddit, limit: posts_by_subreddit.get(subreddit, [])
+            )
             
             feed = await api.get_real_time_feed(min_score=50)
             
@@ -341,15 +408,18 @@ class TestSimpleAPI:
         """Test alert checking"""
         simple_api = SimpleAPI()
         
-        with patch.object(simple_api.api, 'get_speculative_signals') as mock_signals, \
-             patch.object(simple_api.api, 'get_sentiment_overview') as mock_sentiment:
+        with patch.object(simple_api.api, 'get_latest_data') as mock_data:
             
             # High speculation scenario
-            mock_signals.return_value = {"speculative_ratio": 0.4}
-            mock_sentiment.return_value = {"average": 0.6}
+            mock_data.return_value = {
+                "activity_summary": {"speculative_ratio": 0.4},
+                "sentiment_analysis": {"average": 0.6}
+            }
             
             alerts = await simple_api.alert_check()
             
+            mock_data.assert_awaited_once()
+            
             assert alerts["alert_count"] == 2  # High speculation + extreme sentiment
             assert any(alert["type"] == "high_speculation" for alert in alerts["alerts"])
             assert any(alert["type"] == "extreme_sentiment" for alert in alerts["alerts"])
@@ -358,19 +428,19 @@ class TestSimpleAPI:
 @pytest.mark.asyncio
 async def test_get_reddit_insights():
     """Test the convenience function for getting insights"""
-    with patch('api_interface.AnalysisAPI') as mock_api_class:
-        mock_api = MagicMock()
-        mock_api_class.return_value = mock_api
-        
-        # Mock async methods
-        mock_api.get_trending_tickers.return_value = [{"ticker": "AAPL", "mentions": 10}]
-        mock_api.get_sentiment_overview.return_value = {"mood": "neutral"}
-        mock_api.get_speculative_signals.return_value = {"speculative_ratio": 0.2}
-        mock_api.get_priority_posts.return_value = [{"id": "test", "title": "Test"}]
+    with patch.object(AnalysisAPI, 'get_latest_data', new_callable=AsyncMock) as mock_data:
+        mock_data.return_value = {
+            "trending_tickers": {"AAPL": 10},
+            "sentiment_analysis": {"average": 0.0},
+            "activity_summary": {"speculative_ratio": 0.2},
+            "recent_priority_posts": [{"id": "test", "title": "Test"}]
+        }
         
         insights = await get_reddit_insights()
         
-        assert "trending_tickers" in insights
-        assert "market_sentiment" in insights
-        assert "speculative_signals" in insights
-        assert "priority_posts" in insights
\ No newline at end of file
+        # All four sections come from a single data fetch
+        mock_data.assert_awaited_once()
+        assert insights["trending_tickers"][0]["ticker"] == "AAPL"
+        assert insights["market_sentiment"]["mood"] == "neutral"
+        assert insights["speculative_signals"]["speculative_ratio"] == 0.2
+        assert insights["priority_posts"][0]["id"] == "test"
\ No newline at end of file
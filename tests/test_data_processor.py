@@ -150,6 +150,15 @@ class TestDataProcessor:
         
         assert processor.sentiment_scores["bull"] > 0  # Positive sentiment
         assert processor.sentiment_scores["bear"] < 0  # Negative sentiment
+        
+        # Re-analysing a post replaces its earlier score in the summary
+        processor._analyze_sentiment(bullish_post)
+        summary = processor._get_sentiment_summary()
+        assert summary['total'] == 2
+        assert summary['positive'] == 1
+        assert summary['negative'] == 1
+        expected = sum(processor.sentiment_scores.values()) / 2
+        assert summary['average'] == round(expected, 3)
     
     def test_speculative_post_detection(self, temp_data_dir):
         """Test detection of speculative posts"""
@@ -196,6 +205,102 @@ class TestDataProcessor:
         assert processor.is_speculative_post(yolo_post) == True
         assert processor.is_speculative_post(regular_post) == False
     
+    def test_speculative_flags_batch(self, temp_data_dir, sample_reddit_posts):
+        """Test batch speculative classification matches per-post detection"""
+        processor = DataProcessor()
+        
+        # High engagement, recent, but no speculative keywords
+        engaged_post = RedditPost(
+            id="engaged",
+            title="Quarterly earnings discussion",
+            author="user",
+            subreddit="stocks",
+            score=300,
+            upvote_ratio=0.9,
+            num_comments=120,
+            created_utc=time.time() - 1800,
+            url="http://test.com",
+            selftext="Revenue beat estimates",
+            flair=None,
+            stickied=False,
+            over_18=False,
+            category="serious_investing",
+            timestamp_collected=time.time()
+        )
+        posts = sample_reddit_posts + [engaged_post]
+        
+        flags = processor.speculative_flags(posts)
+        
+        assert flags == [processor.is_speculative_post(post) for post in posts]
+        assert flags[-1] == True
+        assert processor.speculative_flags([]) == []
+    
+    def test_keywords_match_whole_words(self, temp_data_dir):
+        """Test keyword scanning ignores keywords embedded in longer words"""
+        processor = DataProcessor()
+        
+        found = processor._scan_keywords("the seller gave a buyback, diamond hands and sell calls")
+        
+        assert found['negative'] == {'sell'}
+        assert found['positive'] == set()
+        assert found['speculative'] == {'diamond hands', 'calls'}
+        assert found['options'] == {'calls'}
+    
+    def test_keywords_match_inflections(self, temp_data_dir):
+        """Test inflected keywords count as their base keyword"""
+        processor = DataProcessor()
+        
+        found = processor._scan_keywords("very bullish, buying calls")
+        assert found['positive'] == {'bull', 'buy'}
+        
+        post = RedditPost(
+            id="inflected",
+            title="very bullish, buying calls",
+            author="user",
+            subreddit="stocks",
+            score=100,
+            upvote_ratio=0.8,
+            num_comments=20,
+            created_utc=time.time(),
+            url="http://test.com",
+            selftext="",
+            flair=None,
+            stickied=False,
+            over_18=False,
+            category="serious_investing",
+            timestamp_collected=time.time()
+        )
+        processor._analyze_sentiment(post)
+        assert processor.sentiment_scores["inflected"] > 0
+    
+    def test_activity_summary_columns(self, temp_data_dir, sample_reddit_posts):
+        """Test column-based activity summary agrees with per-post checks"""
+        processor = DataProcessor()
+        processor.add_posts(sample_reddit_posts)
+        
+        summary = processor._get_activity_summary()
+        
+        expected = sum(processor.is_speculative_post(post) for post in processor.posts_buffer)
+        assert summary['total_posts'] == len(sample_reddit_posts)
+        assert summary['speculative_posts'] == expected
+        assert len(processor.posts_buffer.collected) == len(sample_reddit_posts)
+    
+    def test_post_buffer_merges_interleaved_batches(self, temp_data_dir, sample_reddit_posts):
+        """Test batches collected out of order are merged by collection time"""
+        processor = DataProcessor()
+        base = time.time()
+        for offset, post in zip([3, 1, 4, 0, 2], sample_reddit_posts):
+            post.timestamp_collected = base + offset
+        
+        # Two subreddits' results arriving after a later-collected batch
+        processor.add_posts(sample_reddit_posts[:3])
+        processor.add_posts(sample_reddit_posts[3:])
+        
+        buffer = processor.posts_buffer
+        assert [post.id for post in buffer] == ["test3", "test1", "test4", "test0", "test2"]
+        assert list(buffer.collected) == [base + offset for offset in range(5)]
+        assert list(buffer.scores) == [post.score for post in buffer]
+    
     def test_filter_priority_posts(self, temp_data_dir):
         """Test filtering of priority posts"""
         processor = DataProcessor()
@@ -383,7 +488,9 @@ class TestDataProcessor:
         
         test_data = {
             "metadata": {"timestamp": "2025-01-01T00:00:00"},
-            "test": "data"
+            "test": "data",
+            "priority_posts": [{"id": "a"}, {"id": "b"}],
+            "empty": []
         }
         
         await processor.save_export_data(test_data, "test_export.json")
@@ -399,6 +506,9 @@ class TestDataProcessor:
             saved_data = json.load(f)
         
         assert saved_data == test_data
+        
+        with open(os.path.join(DataConfig.EXPORTS_DIR, "latest.json"), 'r') as f:
+            assert json.load(f) == test_data
     
     def test_cleanup_old_data(self, temp_data_dir):
         """Test cleanup of old data"""
@@ -452,4 +562,14 @@ class TestDataProcessor:
         
         remaining_posts = [post for post in processor.posts_buffer]
         assert len(remaining_posts) == 1
-        assert remaining_posts[0].id == "new"
\ No newline at end of file
+        assert remaining_posts[0].id == "new"
+        
+        activity_posts = processor.subreddit_activity["stocks"]["posts"]
+        assert [entry["id"] for entry in activity_posts] == ["new"]
+        
+        # A stale entry added behind a fresh one is still cleaned up
+        old_post.id = "late_old"
+        processor.add_posts([old_post])
+        processor._cleanup_old_data()
+        activity_posts = processor.subreddit_activity["stocks"]["posts"]
+        assert [entry["id"] for entry in activity_posts] == ["new"]
\ No newline at end of file
@@ -6,7 +6,7 @@ import asyncio
 from unittest.mock import MagicMock, patch, AsyncMock
 import time
 
-from reddit_client import RedditClient, AsyncRedditClient, RedditPost
+from reddit_client import RedditClient, AsyncRedditClient, RedditPost, gather_bounded
 from config import MonitoringConfig
 
 
@@ -50,6 +50,14 @@ class TestRedditPost:
         assert post.meets_criteria(100, 40) == True
         assert post.meets_criteria(200, 40) == False
         assert post.meets_criteria(100, 50) == False
+    
+    def test_post_uses_slots(self, sample_reddit_post):
+        """Test posts are slotted and reject unknown attributes"""
+        post = sample_reddit_post
+        
+        assert not hasattr(post, '__dict__')
+        with pytest.raises(AttributeError):
+            post.unknown_field = 1
 
 
 class TestRedditClient:
@@ -214,6 +222,30 @@ class TestAsyncRedditClient:
                 pytest.skip("Monitor test timed out - expected behavior")
 
 
+
+@pytest.mark.asyncio
+async def test_gather_bounded():
+    """Test gather_bounded caps concurrency and keeps result order"""
+    in_flight = 0
+    peak = 0
+    
+    async def fetch(value):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if value == 3:
+            raise ValueError(value)
+        return value
+    
+    results = await gather_bounded([fetch(i) for i in range(10)], limit=2, return_exceptions=True)
+    
+    assert peak == 2
+    assert results[:3] == [0, 1, 2]
+    assert isinstance(results[3], ValueError)
+    assert results[4:] == list(range(4, 10))
+
 class MockAsyncSubmission:
     """Mock async PRAW submission"""
     
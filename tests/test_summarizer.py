@@ -0,0 +1,93 @@
+"""
+Tests for content summarizer functionality
+"""
+import pytest
+import time
+
+from backend.intelligence import summarizer as summarizer_module
+from backend.intelligence.summarizer import ContentSummarizer, batch_summarize
+from reddit_client import RedditPost
+
+
+class TestContentSummarizer:
+    """Tests for ContentSummarizer class"""
+    
+    def test_action_items_match_inflections(self):
+        """Test inflected action verbs still suggest their action item"""
+        summarizer = ContentSummarizer()
+        
+        actions = summarizer._extract_action_items("still buying the dip and watching earnings")
+        assert actions == ['Consider buying', 'Monitor closely']
+        
+        # Longer words that merely start with an action verb don't count
+        assert summarizer._extract_action_items("the seller held a buyback") == []
+    
+    @pytest.mark.asyncio
+    async def test_batch_summarize_process_pool(self):
+        """Test a pooled batch gives the same summaries as in-process summarization"""
+        posts = [
+            {
+                'id': f'post{i}',
+                'title': f'$AAPL up {i}% after earnings, buying more calls',
+                'selftext': 'Revenue beat estimates. Holding until the next report! Watching volatility.',
+                'subreddit': 'stocks',
+                'category': 'serious_investing'
+            }
+            for i in range(4)
+        ]
+        
+        local = ContentSummarizer()
+        local.process_workers = 1
+        assert not local.uses_process_pool(len(posts))
+        expected = await batch_summarize(posts, local)
+        # The shared summary cache would otherwise answer the pooled run
+        summarizer_module._summary_cache.clear()
+        
+        pooled = ContentSummarizer()
+        pooled.process_workers = 2
+        pooled.process_min_batch = len(posts)
+        assert pooled.uses_process_pool(len(posts))
+        assert not pooled.uses_process_pool(len(posts) - 1)
+        try:
+            results = await batch_summarize(posts, pooled)
+            assert pooled._process_pool is not None
+        finally:
+            await pooled.close()
+        
+        for result, reference in zip(results, expected):
+            assert result.original_id == reference.original_id
+            assert result.summary_sentence == reference.summary_sentence
+            assert result.key_points == reference.key_points
+            assert result.tickers_mentioned == reference.tickers_mentioned == ['AAPL']
+            assert result.action_items == reference.action_items
+    
+    @pytest.mark.asyncio
+    async def test_summary_cache_shared_across_summarizers(self):
+        """Test a fresh summarizer reuses summaries until the post's text changes"""
+        post = RedditPost(
+            id="cached1",
+            title="$TSLA earnings beat, holding shares",
+            author="user",
+            subreddit="stocks",
+            score=120,
+            upvote_ratio=0.9,
+            num_comments=30,
+            created_utc=time.time(),
+            url="http://test.com",
+            selftext="Deliveries were up 20% this quarter.",
+            flair=None,
+            stickied=False,
+            over_18=False,
+            category="serious_investing",
+            timestamp_collected=time.time()
+        )
+        
+        # Each request builds its own summarizer, as the serverless feed does
+        first = await ContentSummarizer().summarize_post(post.to_dict())
+        again = await ContentSummarizer().summarize_post(post.to_dict())
+        assert again is first
+        
+        post.selftext = "Deliveries were down 5% this quarter."
+        edited = await ContentSummarizer().summarize_post(post.to_dict())
+        assert edited is not first
+        assert edited.original_id == "cached1"